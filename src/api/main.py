@@ -7,6 +7,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.routes import admin, auth, documents, health, history, validate
+from src.pipeline.file_storage import HASH_BACKEND, init_storage
 from src.storage.database import init_db
 
 
@@ -56,7 +57,9 @@ async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
     await init_db()
+    init_storage()
     await ensure_admin_exists()
+    print(f"Upload hashing backend: SHA256 ({HASH_BACKEND})")
     yield
     # Shutdown
 
@@ -1,5 +1,6 @@
 """Authentication endpoints."""
 
+import hmac
 from datetime import datetime, timedelta
 from uuid import UUID
 
@@ -13,7 +14,7 @@ from src.domain.schemas.auth import (
 )
 from src.domain.services.auth import (
     verify_password,
-    create_access_token,
+    create_access_token_with_hash,
     hash_token,
     hash_password,
     verify_token,
@@ -82,7 +83,7 @@ async def login(
     user.locked_until = None
 
     # Create JWT token
-    token, expires_at = create_access_token(
+    token, token_hash, expires_at = create_access_token_with_hash(
         user_id=user.id,
         email=user.email,
         is_admin=user.is_superuser,
@@ -109,7 +110,7 @@ async def login(
     # Create session record
     session = Session(
         user_id=user.id,
-        token_hash=hash_token(token),
+        token_hash=token_hash,
         device_info=request.headers.get("User-Agent"),
         ip_address=request.client.host if request.client else None,
         expires_at=expires_at,
@@ -328,7 +329,10 @@ async def reset_password(
     )
     token_record = result.scalar_one_or_none()
 
-    if not token_record:
+    # The indexed lookup finds the row; confirm the hash in constant time
+    if not token_record or not hmac.compare_digest(
+        token_record.token_hash, token_hash_value
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid or expired reset token",
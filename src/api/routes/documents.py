@@ -60,7 +60,7 @@ async def upload_document(
 
     try:
         # Save file and get metadata (validates extension and calculates hash)
-        file_path, file_hash, file_size = await save_upload(file)
+        file_path, file_hash, file_size = await save_upload(file, session)
 
         # Double-check file size after reading
         if file_size > MAX_FILE_SIZE:
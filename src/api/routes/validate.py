@@ -23,9 +23,7 @@ from src.domain.validators.calibration import validate_calibration
 from src.domain.validators.camera_config import validate_camera_config
 from src.domain.validators.grounding_calibration import validate_grounding_calibration
 from src.domain.validators.grounding_resistance import validate_grounding_resistance
-from src.domain.validators.megger_calibration import validate_megger_calibration
-from src.domain.validators.megger_insulation import validate_insulation_resistance
-from src.domain.validators.megger_voltage import validate_test_voltage
+from src.domain.validators.megger import validate_megger_all
 from src.domain.validators.phase_delta import validate_phase_delta
 from src.domain.validators.serial import collect_serial_numbers, validate_serial_consistency
 from src.domain.validators.test_method import validate_test_method
@@ -163,18 +161,10 @@ async def validate_document(
         all_findings.extend(method_findings)
 
     # 5e. Megger validation (MEGGER-01, MEGGER-02, MEGGER-03)
+    # Single pass over the megger data - equipment voltage is parsed once
     if extraction.megger:
-        # MEGGER-01: Megger calibration validation
-        megger_cal_findings = validate_megger_calibration(extraction.megger, test_date)
-        all_findings.extend(megger_cal_findings)
-
-        # MEGGER-02: Test voltage validation
-        voltage_findings = validate_test_voltage(extraction.megger)
-        all_findings.extend(voltage_findings)
-
-        # MEGGER-03: Insulation resistance validation
-        insulation_findings = validate_insulation_resistance(extraction.megger)
-        all_findings.extend(insulation_findings)
+        megger_findings = validate_megger_all(extraction.megger, test_date)
+        all_findings.extend(megger_findings)
 
     # 6. Compute overall status from findings
     computed_status = compute_status(all_findings)
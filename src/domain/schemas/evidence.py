@@ -32,8 +32,16 @@ class Finding(BaseModel):
 
     Represents one check result with full context for audit trail.
     Contains what was checked, what was found, and what was expected.
+
+    Frozen: findings are immutable audit records, which also lets validators
+    safely reuse prebuilt instances across calls.
+
+    Rule validators build findings from already-typed values, so the hot
+    paths use Finding.model_construct() to skip field validation.
     """
 
+    model_config = {"frozen": True}
+
     rule_id: str = Field(
         description="Validation rule identifier, e.g., 'VAL-01', 'VAL-02'"
     )
@@ -21,4 +21,5 @@ class UserRead(BaseModel):
     is_active: bool
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    # Read-only response DTO
+    model_config = {"from_attributes": True, "frozen": True}
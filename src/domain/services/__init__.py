@@ -2,6 +2,7 @@
 
 from .auth import (
     create_access_token,
+    create_access_token_with_hash,
     generate_reset_token,
     generate_temp_password,
     hash_password,
@@ -15,6 +16,7 @@ __all__ = [
     "hash_password",
     "verify_password",
     "create_access_token",
+    "create_access_token_with_hash",
     "verify_token",
     "hash_token",
     "generate_temp_password",
@@ -11,8 +11,11 @@ from jose import JWTError, jwt
 from pwdlib import PasswordHash
 from pwdlib.hashers.bcrypt import BcryptHasher
 
-# Password hashing using bcrypt via pwdlib
-pwd_context = PasswordHash((BcryptHasher(),))
+# Password hashing using bcrypt via pwdlib. The cost factor can be lowered
+# through BCRYPT_ROUNDS for tests; hashes embed their cost, so existing
+# hashes verify whatever the current setting.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+pwd_context = PasswordHash((BcryptHasher(rounds=BCRYPT_ROUNDS),))
 
 # JWT settings (use env vars with defaults)
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "dev-secret-change-in-production")
@@ -64,6 +67,23 @@ def create_access_token(
     return token, expires_at
 
 
+def create_access_token_with_hash(
+    user_id: UUID,
+    email: str,
+    is_admin: bool,
+    remember_me: bool = False,
+) -> tuple[str, str, datetime]:
+    """Create JWT access token along with its session lookup hash.
+
+    Same as create_access_token, for callers that store a Session row.
+
+    Returns:
+        Tuple of (token, token_hash, expires_at datetime)
+    """
+    token, expires_at = create_access_token(user_id, email, is_admin, remember_me)
+    return token, hash_token(token), expires_at
+
+
 def verify_token(token: str) -> dict | None:
     """Verify and decode JWT.
 
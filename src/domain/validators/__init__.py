@@ -1,13 +1,16 @@
 """Validation utilities for AuditEng V2."""
 
+from src.domain.validators.batch import validate_groundings_batch, validate_meggers_batch
 from src.domain.validators.calibration import validate_calibration
 from src.domain.validators.camera_config import validate_camera_config
 from src.domain.validators.date_parser import DateFormat, detect_format, parse_date
 from src.domain.validators.grounding_calibration import validate_grounding_calibration
 from src.domain.validators.grounding_resistance import validate_grounding_resistance
+from src.domain.validators.megger import validate_megger_all
 from src.domain.validators.megger_calibration import validate_megger_calibration
 from src.domain.validators.megger_insulation import validate_insulation_resistance
 from src.domain.validators.megger_voltage import validate_test_voltage
+from src.domain.validators.numeric_parser import parse_float
 from src.domain.validators.phase_delta import validate_phase_delta
 from src.domain.validators.serial import collect_serial_numbers, validate_serial_consistency
 from src.domain.validators.test_method import VALID_TEST_METHODS, validate_test_method
@@ -16,6 +19,7 @@ __all__ = [
     "parse_date",
     "detect_format",
     "DateFormat",
+    "parse_float",
     "validate_calibration",
     "validate_camera_config",
     "validate_grounding_calibration",
@@ -23,6 +27,9 @@ __all__ = [
     "validate_megger_calibration",
     "validate_test_voltage",
     "validate_insulation_resistance",
+    "validate_megger_all",
+    "validate_groundings_batch",
+    "validate_meggers_batch",
     "validate_phase_delta",
     "validate_serial_consistency",
     "collect_serial_numbers",
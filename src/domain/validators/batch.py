@@ -0,0 +1,70 @@
+"""Batch validation across many reports.
+
+Validators are pure, CPU-bound functions of their input, so fleet-scale
+audits (thousands of reports) can spread them across worker processes.
+Inputs and findings are pydantic models, which pickle across processes.
+"""
+
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from functools import partial
+from typing import TypeVar
+
+from src.domain.schemas.evidence import Finding
+from src.domain.schemas.extraction import GroundingData, MeggerData
+from src.domain.validators.grounding_resistance import validate_grounding_resistance
+from src.domain.validators.megger import validate_megger_all
+
+T = TypeVar("T")
+
+
+def _run_batch(
+    validator: Callable[[T], list[Finding]],
+    items: Sequence[T],
+    max_workers: int | None,
+) -> list[list[Finding]]:
+    """Map a validator over items in a process pool, preserving order."""
+    if not items:
+        return []
+
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(items) // workers)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(validator, items, chunksize=chunksize))
+
+
+def validate_groundings_batch(
+    groundings: Sequence[GroundingData],
+    max_workers: int | None = None,
+) -> list[list[Finding]]:
+    """Run GROUND-02 resistance validation over many grounding reports.
+
+    Args:
+        groundings: Grounding data from each report.
+        max_workers: Worker process count. Defaults to the CPU count.
+
+    Returns:
+        One findings list per input, in input order.
+    """
+    return _run_batch(validate_grounding_resistance, groundings, max_workers)
+
+
+def validate_meggers_batch(
+    meggers: Sequence[MeggerData],
+    test_date: date,
+    max_workers: int | None = None,
+) -> list[list[Finding]]:
+    """Run MEGGER-01/02/03 validation over many megger reports.
+
+    Args:
+        meggers: Megger data from each report.
+        test_date: Date when the megger tests were performed.
+        max_workers: Worker process count. Defaults to the CPU count.
+
+    Returns:
+        One findings list per input, in input order.
+    """
+    return _run_batch(partial(validate_megger_all, test_date=test_date), meggers, max_workers)
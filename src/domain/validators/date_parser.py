@@ -11,6 +11,7 @@ For ambiguous dates like "01/02/2024", prefers DD/MM/YYYY (Brazilian standard).
 import re
 from datetime import date
 from enum import Enum
+from functools import lru_cache
 
 
 class DateFormat(str, Enum):
@@ -21,10 +22,39 @@ class DateFormat(str, Enum):
     MM_DD_YY = "MM_DD_YY"  # MM/DD/YY (American 2-digit year)
 
 
-# Regex patterns for format detection
-_ISO_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
-_DD_MM_YYYY_PATTERN = re.compile(r"^\d{1,2}/\d{1,2}/\d{4}$")
-_MM_DD_YY_PATTERN = re.compile(r"^\d{1,2}/\d{1,2}/\d{2}$")
+# One pattern for all three formats; the named groups of the alternative
+# that matched give both the format and the date fields
+_DATE_PATTERN = re.compile(
+    r"^(?:"
+    r"(?P<iso_y>\d{4})-(?P<iso_m>\d{2})-(?P<iso_d>\d{2})"
+    r"|(?P<br_d>\d{1,2})/(?P<br_m>\d{1,2})/(?P<br_y>\d{4})"
+    r"|(?P<us_m>\d{1,2})/(?P<us_d>\d{1,2})/(?P<us_y>\d{2})"
+    r")$"
+)
+
+
+def _match_format(match: re.Match[str]) -> DateFormat:
+    """Format of the _DATE_PATTERN alternative that matched."""
+    if match["iso_y"] is not None:
+        return DateFormat.ISO
+    if match["br_y"] is not None:
+        return DateFormat.DD_MM_YYYY
+    return DateFormat.MM_DD_YY
+
+
+def _match_date(match: re.Match[str]) -> date | None:
+    """Build the date from a _DATE_PATTERN match; None if invalid (e.g. Feb 31)."""
+    if match["iso_y"] is not None:
+        year, month, day = match["iso_y"], match["iso_m"], match["iso_d"]
+    elif match["br_y"] is not None:
+        year, month, day = match["br_y"], match["br_m"], match["br_d"]
+    else:
+        # 2-digit years assumed to be 2000s (00-99 -> 2000-2099)
+        year, month, day = 2000 + int(match["us_y"]), match["us_m"], match["us_d"]
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
 
 
 def detect_format(value: str) -> DateFormat | None:
@@ -39,16 +69,10 @@ def detect_format(value: str) -> DateFormat | None:
     if not value:
         return None
 
-    value = value.strip()
-
-    if _ISO_PATTERN.match(value):
-        return DateFormat.ISO
-    if _DD_MM_YYYY_PATTERN.match(value):
-        return DateFormat.DD_MM_YYYY
-    if _MM_DD_YY_PATTERN.match(value):
-        return DateFormat.MM_DD_YY
-
-    return None
+    match = _DATE_PATTERN.match(value.strip())
+    if match is None:
+        return None
+    return _match_format(match)
 
 
 def _parse_iso(value: str) -> date | None:
@@ -123,16 +147,26 @@ def parse_date(value: str | None, hint: DateFormat | None = None) -> date | None
     if not value:
         return None
 
+    return _parse_stripped(value, hint)
+
+
+@lru_cache(maxsize=1024)
+def _parse_stripped(value: str, hint: DateFormat | None) -> date | None:
+    """Parse a stripped, non-empty date string.
+
+    Cached by (value, hint) since batch audits repeat the same certificate
+    dates across reports; date objects are immutable, so sharing is safe.
+    """
     # If hint provided, try that format first
     if hint is not None:
         result = _try_format(value, hint)
         if result is not None:
             return result
 
-    # Detect format from value pattern
-    detected = detect_format(value)
-    if detected is not None:
-        return _try_format(value, detected)
+    # Detect the format and read the fields in a single regex match
+    match = _DATE_PATTERN.match(value)
+    if match is not None:
+        return _match_date(match)
 
     return None
 
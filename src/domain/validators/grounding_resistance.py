@@ -12,13 +12,113 @@ Core principle: Zero false rejections. When uncertain (missing/unparseable value
 use WARNING (REVIEW_NEEDED) instead of ERROR (REJECTED).
 """
 
+from functools import lru_cache
+
 from src.domain.schemas.evidence import Finding, FindingSeverity
 from src.domain.schemas.extraction import GroundingData
+from src.domain.validators.numeric_parser import parse_float
+
+# Finding field names, shared by every finding this rule emits
+_FIELD_RESISTANCE = "grounding_resistance"
 
 # Threshold constants (in ohms)
 RESISTANCE_WARNING_THRESHOLD = 5.0  # > 5 ohms needs review
 RESISTANCE_ERROR_THRESHOLD = 10.0  # > 10 ohms is failure
 
+# Expected-value strings only depend on the thresholds
+_EXPECTED_OK = f"<= {RESISTANCE_WARNING_THRESHOLD} ohms"
+_EXPECTED_ERR = f"<= {RESISTANCE_ERROR_THRESHOLD} ohms"
+
+_DEFAULT_RULE_ID = "GROUND-02"
+
+# Message templates (str.format); threshold values are baked in at import
+_MSG_UNPARSEABLE = (
+    "Could not parse grounding resistance '{value}' as numeric value - manual review required"
+)
+_MSG_NEGATIVE = (
+    "Grounding resistance {resistance} ohms is negative (invalid measurement) "
+    "- manual review required"
+)
+_MSG_ERROR = (
+    "Grounding resistance {resistance} ohms exceeds maximum of "
+    f"{RESISTANCE_ERROR_THRESHOLD} ohms"
+)
+_MSG_BORDERLINE = (
+    "Grounding resistance {resistance} ohms is borderline - review recommended "
+    f"(threshold: {RESISTANCE_WARNING_THRESHOLD} ohms)"
+)
+_MSG_OK = (
+    "Grounding resistance {resistance} ohms within acceptable range "
+    f"({_EXPECTED_OK})"
+)
+
+
+def _missing_resistance_finding(rule_id: str) -> Finding:
+    """Build the WARNING finding for a report without a resistance field."""
+    return Finding.model_construct(
+        rule_id=rule_id,
+        severity=FindingSeverity.WARNING,
+        message="Grounding resistance value not found - manual review required",
+        field_name=_FIELD_RESISTANCE,
+        found_value=None,
+        expected_value="numeric resistance in ohms",
+        location=None,
+    )
+
+
+# All fields are literals, so the default-rule finding is built once at import
+_MISSING_RESISTANCE_FINDING = _missing_resistance_finding(_DEFAULT_RULE_ID)
+
+
+@lru_cache(maxsize=256)
+def _classify_resistance(raw_value: str) -> tuple[FindingSeverity, str, str, str]:
+    """Classify a numeric resistance string against the thresholds.
+
+    Cached since batch audits repeat the same readings across reports. Keyed
+    on the raw string rather than the float, as equal floats (0.0 and -0.0)
+    would otherwise share a message. The caller has already checked that
+    raw_value parses, and attaches rule_id and location to build the Finding.
+
+    Returns:
+        Tuple of (severity, message, found_value, expected_value).
+    """
+    resistance = parse_float(raw_value)
+    assert resistance is not None
+    found_value = f"{resistance} ohms"
+
+    # Negative value (invalid measurement)
+    if resistance < 0:
+        return (
+            FindingSeverity.WARNING,
+            _MSG_NEGATIVE.format(resistance=resistance),
+            found_value,
+            ">= 0 ohms",
+        )
+
+    if resistance > RESISTANCE_ERROR_THRESHOLD:
+        # Critical failure - ERROR
+        return (
+            FindingSeverity.ERROR,
+            _MSG_ERROR.format(resistance=resistance),
+            found_value,
+            _EXPECTED_ERR,
+        )
+    if resistance > RESISTANCE_WARNING_THRESHOLD:
+        # Borderline - WARNING
+        return (
+            FindingSeverity.WARNING,
+            _MSG_BORDERLINE.format(resistance=resistance),
+            found_value,
+            _EXPECTED_OK,
+        )
+    # Acceptable - INFO
+    return (
+        FindingSeverity.INFO,
+        _MSG_OK.format(resistance=resistance),
+        found_value,
+        _EXPECTED_OK,
+    )
+
 
 def validate_grounding_resistance(
     grounding: GroundingData,
@@ -40,110 +140,54 @@ def validate_grounding_resistance(
         - INFO if resistance <= 5 ohms (acceptable)
         - WARNING if value is missing/unparseable/negative
     """
-    findings: list[Finding] = []
-
     # Case 1: Missing resistance field entirely
     if grounding.resistance_value is None:
-        findings.append(
-            Finding(
-                rule_id=rule_id,
-                severity=FindingSeverity.WARNING,
-                message="Grounding resistance value not found - manual review required",
-                field_name="grounding_resistance",
-                found_value=None,
-                expected_value="numeric resistance in ohms",
-                location=None,
-            )
-        )
-        return findings
+        if rule_id == _DEFAULT_RULE_ID:
+            return [_MISSING_RESISTANCE_FINDING]
+        return [_missing_resistance_finding(rule_id)]
 
     # Case 2: Field exists but value is None or empty
+    # strip() is only needed when the value starts or ends with whitespace
     raw_value = grounding.resistance_value.value
-    if raw_value is None or raw_value.strip() == "":
-        findings.append(
-            Finding(
+    if not raw_value or (
+        (raw_value[0].isspace() or raw_value[-1].isspace()) and not raw_value.strip()
+    ):
+        return [
+            Finding.model_construct(
                 rule_id=rule_id,
                 severity=FindingSeverity.WARNING,
                 message="Grounding resistance value is missing or empty - manual review required",
-                field_name="grounding_resistance",
+                field_name=_FIELD_RESISTANCE,
                 found_value=raw_value,
                 expected_value="numeric resistance in ohms",
                 location=grounding.resistance_value.location,
             )
-        )
-        return findings
+        ]
 
     # Case 3: Try to parse as float
-    try:
-        resistance = float(raw_value)
-    except (ValueError, TypeError):
-        findings.append(
-            Finding(
+    if parse_float(raw_value) is None:
+        return [
+            Finding.model_construct(
                 rule_id=rule_id,
                 severity=FindingSeverity.WARNING,
-                message=f"Could not parse grounding resistance '{raw_value}' as numeric value - manual review required",
-                field_name="grounding_resistance",
+                message=_MSG_UNPARSEABLE.format(value=raw_value),
+                field_name=_FIELD_RESISTANCE,
                 found_value=raw_value,
                 expected_value="numeric resistance in ohms",
                 location=grounding.resistance_value.location,
             )
+        ]
+
+    # Cases 4-5: Negative value check and threshold evaluation
+    severity, message, found_value, expected_value = _classify_resistance(raw_value)
+    return [
+        Finding.model_construct(
+            rule_id=rule_id,
+            severity=severity,
+            message=message,
+            field_name=_FIELD_RESISTANCE,
+            found_value=found_value,
+            expected_value=expected_value,
+            location=grounding.resistance_value.location,
         )
-        return findings
-
-    # Case 4: Negative value (invalid measurement)
-    if resistance < 0:
-        findings.append(
-            Finding(
-                rule_id=rule_id,
-                severity=FindingSeverity.WARNING,
-                message=f"Grounding resistance {resistance} ohms is negative (invalid measurement) - manual review required",
-                field_name="grounding_resistance",
-                found_value=f"{resistance} ohms",
-                expected_value=">= 0 ohms",
-                location=grounding.resistance_value.location,
-            )
-        )
-        return findings
-
-    # Case 5: Evaluate against thresholds
-    if resistance > RESISTANCE_ERROR_THRESHOLD:
-        # Critical failure - ERROR
-        findings.append(
-            Finding(
-                rule_id=rule_id,
-                severity=FindingSeverity.ERROR,
-                message=f"Grounding resistance {resistance} ohms exceeds maximum of {RESISTANCE_ERROR_THRESHOLD} ohms",
-                field_name="grounding_resistance",
-                found_value=f"{resistance} ohms",
-                expected_value=f"<= {RESISTANCE_ERROR_THRESHOLD} ohms",
-                location=grounding.resistance_value.location,
-            )
-        )
-    elif resistance > RESISTANCE_WARNING_THRESHOLD:
-        # Borderline - WARNING
-        findings.append(
-            Finding(
-                rule_id=rule_id,
-                severity=FindingSeverity.WARNING,
-                message=f"Grounding resistance {resistance} ohms is borderline - review recommended (threshold: {RESISTANCE_WARNING_THRESHOLD} ohms)",
-                field_name="grounding_resistance",
-                found_value=f"{resistance} ohms",
-                expected_value=f"<= {RESISTANCE_WARNING_THRESHOLD} ohms",
-                location=grounding.resistance_value.location,
-            )
-        )
-    else:
-        # Acceptable - INFO
-        findings.append(
-            Finding(
-                rule_id=rule_id,
-                severity=FindingSeverity.INFO,
-                message=f"Grounding resistance {resistance} ohms within acceptable range (<= {RESISTANCE_WARNING_THRESHOLD} ohms)",
-                field_name="grounding_resistance",
-                found_value=f"{resistance} ohms",
-                expected_value=f"<= {RESISTANCE_WARNING_THRESHOLD} ohms",
-                location=grounding.resistance_value.location,
-            )
-        )
-
-    return findings
+    ]
@@ -0,0 +1,50 @@
+"""Combined megger test validation.
+
+Runs MEGGER-01 (calibration), MEGGER-02 (test voltage) and MEGGER-03
+(insulation resistance) over one MeggerData in a single pass. The equipment
+voltage rating is shared by MEGGER-02 and MEGGER-03, so it is parsed once
+here and handed to both rules.
+"""
+
+from datetime import date
+
+from src.domain.schemas.evidence import Finding
+from src.domain.schemas.extraction import MeggerData
+from src.domain.validators.calibration import validate_calibration
+from src.domain.validators.megger_calibration import _MISSING_CALIBRATION_FINDING
+from src.domain.validators.megger_insulation import validate_insulation_resistance
+from src.domain.validators.megger_voltage import validate_test_voltage
+from src.domain.validators.numeric_parser import parse_float
+
+
+def validate_megger_all(megger: MeggerData, test_date: date) -> list[Finding]:
+    """Validate all megger rules for a single megger test.
+
+    Produces the same findings, in the same order, as calling
+    validate_megger_calibration, validate_test_voltage and
+    validate_insulation_resistance one after another.
+
+    Args:
+        megger: Megger test data from extraction.
+        test_date: Date when the megger test was performed.
+
+    Returns:
+        List of findings from MEGGER-01, MEGGER-02 and MEGGER-03.
+    """
+    equipment_voltage: float | None = None
+    rating = megger.equipment_voltage_rating
+    if rating is not None and rating.value is not None:
+        equipment_voltage = parse_float(rating.value)
+
+    # MEGGER-01 inlined: missing calibration (common in field reports) reuses
+    # the prebuilt finding instead of going through validate_megger_calibration
+    findings: list[Finding]
+    if megger.calibration is None:
+        findings = [_MISSING_CALIBRATION_FINDING]
+    else:
+        findings = validate_calibration(megger.calibration, test_date, "MEGGER-01")
+    findings.extend(validate_test_voltage(megger, equipment_voltage=equipment_voltage))
+    findings.extend(
+        validate_insulation_resistance(megger, equipment_voltage=equipment_voltage)
+    )
+    return findings
@@ -10,6 +10,25 @@ from src.domain.schemas.evidence import Finding, FindingSeverity
 from src.domain.schemas.extraction import MeggerData
 from src.domain.validators.calibration import validate_calibration
 
+_DEFAULT_RULE_ID = "MEGGER-01"
+
+
+def _missing_calibration_finding(rule_id: str) -> Finding:
+    """Build the WARNING finding for a megger test without calibration info."""
+    return Finding.model_construct(
+        rule_id=rule_id,
+        severity=FindingSeverity.WARNING,
+        message="Megger calibration information missing - manual review required",
+        field_name="megger_calibration",
+        found_value=None,
+        expected_value=None,
+        location=None,
+    )
+
+
+# All fields are literals, so the default-rule finding is built once at import
+_MISSING_CALIBRATION_FINDING = _missing_calibration_finding(_DEFAULT_RULE_ID)
+
 
 def validate_megger_calibration(
     megger: MeggerData,
@@ -32,15 +51,7 @@ def validate_megger_calibration(
         - Results from validate_calibration if calibration present
     """
     if megger.calibration is None:
-        return [
-            Finding(
-                rule_id=rule_id,
-                severity=FindingSeverity.WARNING,
-                message="Megger calibration information missing - manual review required",
-                field_name="megger_calibration",
-                found_value=None,
-                expected_value=None,
-                location=None,
-            )
-        ]
+        if rule_id == _DEFAULT_RULE_ID:
+            return [_MISSING_CALIBRATION_FINDING]
+        return [_missing_calibration_finding(rule_id)]
     return validate_calibration(megger.calibration, test_date, rule_id)
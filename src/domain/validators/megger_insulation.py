@@ -11,8 +11,37 @@ Core principle: Zero false rejections. Resistance below minimum is WARNING
 not ERROR (could be measurement conditions, temperature effects, etc.)
 """
 
+import math
+from bisect import bisect_left
+from functools import lru_cache
+
 from src.domain.schemas.evidence import Finding, FindingSeverity
 from src.domain.schemas.extraction import MeggerData
+from src.domain.validators.numeric_parser import parse_float
+from src.domain.validators.required_fields import RequiredField, check_required_fields
+
+# Finding field names, shared by every finding this rule emits
+_FIELD_EQUIPMENT_VOLTAGE = "equipment_voltage_rating"
+_FIELD_INSULATION_RESISTANCE = "insulation_resistance"
+
+# Message templates (str.format), filled with the parsed values
+_MSG_UNPARSEABLE_RATING = (
+    "Could not parse equipment voltage rating '{value}' - manual review required"
+)
+_MSG_UNPARSEABLE_RESISTANCE = (
+    "Could not parse insulation resistance '{value}' - manual review required"
+)
+_MSG_UNKNOWN_CLASS = (
+    "Unknown voltage class for equipment rated {equipment}V - manual review required"
+)
+_MSG_BELOW_MINIMUM = (
+    "Insulation resistance {resistance} Mohm below minimum {minimum} Mohm for "
+    "equipment rated {equipment}V - review required"
+)
+_MSG_MEETS_MINIMUM = (
+    "Insulation resistance {resistance} Mohm meets minimum requirement "
+    "({minimum} Mohm) for equipment rated {equipment}V"
+)
 
 # Minimum insulation resistance by voltage class (in Megohms)
 # Format: (max_equipment_voltage, min_resistance_mohm)
@@ -23,21 +52,104 @@ VOLTAGE_CLASS_MIN_RESISTANCE = [
     (float('inf'), 1.0),  # > 1000V: min 1.0 Mohm per 1000V (simplified)
 ]
 
+# Parallel lookup tables derived from VOLTAGE_CLASS_MIN_RESISTANCE for bisect search
+_MAX_EQUIPMENT_VOLTAGES = tuple(max_equip for max_equip, _ in VOLTAGE_CLASS_MIN_RESISTANCE)
+_MIN_RESISTANCES = tuple(min_resistance for _, min_resistance in VOLTAGE_CLASS_MIN_RESISTANCE)
+
+# Fields that must be present before the minimum resistance can be checked
+_REQUIRED_FIELDS: tuple[RequiredField, ...] = (
+    (
+        _FIELD_EQUIPMENT_VOLTAGE,
+        "Equipment voltage rating missing - cannot determine minimum insulation resistance requirement",
+        "Equipment voltage rating value is empty - cannot determine minimum resistance",
+        "equipment voltage rating in volts",
+    ),
+    (
+        _FIELD_INSULATION_RESISTANCE,
+        "Insulation resistance value missing - cannot validate minimum requirement",
+        "Insulation resistance value is empty - cannot validate minimum requirement",
+        "insulation resistance in megohms",
+    ),
+)
+
+
+def _compute_min_resistance(equipment_voltage: float) -> float | None:
+    """Search the voltage class table for given equipment voltage.
+
+    Returns minimum resistance in Megohms or None if not found.
+    """
+    if math.isnan(equipment_voltage):
+        return None
+    idx = bisect_left(_MAX_EQUIPMENT_VOLTAGES, equipment_voltage)
+    if idx == len(_MIN_RESISTANCES):
+        return None
+    return _MIN_RESISTANCES[idx]
+
+
+# Precomputed minimums for every whole-volt rating up to 5 kV. Only whole-volt
+# ratings are looked up here; fractional ratings fall back to the search.
+_VOLTAGE_TO_MIN_RESISTANCE: dict[int, float | None] = {
+    voltage: _compute_min_resistance(float(voltage)) for voltage in range(0, 5001)
+}
+
 
 def _get_min_resistance(equipment_voltage: float) -> float | None:
     """Get minimum required insulation resistance for given equipment voltage.
 
     Returns minimum resistance in Megohms or None if not found.
     """
-    for max_equip, min_resistance in VOLTAGE_CLASS_MIN_RESISTANCE:
-        if equipment_voltage <= max_equip:
-            return min_resistance
-    return None
+    min_resistance = None
+    if equipment_voltage % 1 == 0:  # whole volts; false for NaN and inf
+        min_resistance = _VOLTAGE_TO_MIN_RESISTANCE.get(int(equipment_voltage))
+    if min_resistance is None:
+        return _compute_min_resistance(equipment_voltage)
+    return min_resistance
+
+
+@lru_cache(maxsize=256)
+def _classify_insulation(
+    equipment_voltage: float,
+    resistance: float,
+    min_resistance: float,
+) -> tuple[FindingSeverity, str, str, str]:
+    """Classify a parsed insulation resistance against its class minimum.
+
+    Cached by value since batch audits repeat the same readings across
+    reports; the caller attaches rule_id and location to build the Finding.
+
+    Returns:
+        Tuple of (severity, message, found_value, expected_value).
+    """
+    found_value = f"{resistance} Mohm"
+    expected_value = f">= {min_resistance} Mohm"
+
+    # Resistance BELOW minimum - WARNING (not ERROR per zero false rejections)
+    if resistance < min_resistance:
+        return (
+            FindingSeverity.WARNING,
+            _MSG_BELOW_MINIMUM.format(
+                resistance=resistance, minimum=min_resistance, equipment=equipment_voltage
+            ),
+            found_value,
+            expected_value,
+        )
+
+    # Resistance at or above minimum - INFO
+    return (
+        FindingSeverity.INFO,
+        _MSG_MEETS_MINIMUM.format(
+            resistance=resistance, minimum=min_resistance, equipment=equipment_voltage
+        ),
+        found_value,
+        expected_value,
+    )
 
 
 def validate_insulation_resistance(
     megger: MeggerData,
     rule_id: str = "MEGGER-03",
+    *,
+    equipment_voltage: float | None = None,
 ) -> list[Finding]:
     """Validate insulation resistance meets minimum requirements.
 
@@ -47,6 +159,8 @@ def validate_insulation_resistance(
     Args:
         megger: Megger test data containing equipment rating and resistance.
         rule_id: Validation rule identifier for tracing.
+        equipment_voltage: Equipment voltage rating already parsed by the caller
+            (see validate_megger_all). Parsed from megger when None.
 
     Returns:
         List of findings based on resistance check:
@@ -54,144 +168,74 @@ def validate_insulation_resistance(
         - INFO if resistance at or above minimum (approved)
         - WARNING if values are missing/unparseable
     """
-    findings: list[Finding] = []
-
-    # Case 1: Missing equipment voltage rating
-    if megger.equipment_voltage_rating is None:
-        findings.append(
-            Finding(
+    # Cases 1-4: Missing equipment voltage rating or insulation resistance
+    missing_findings = check_required_fields(megger, _REQUIRED_FIELDS, rule_id)
+    if missing_findings is not None:
+        return missing_findings
+
+    # Both fields were checked above; bind them narrowed to ExtractedField
+    equipment_field = megger.equipment_voltage_rating
+    resistance_field = megger.insulation_resistance
+    assert equipment_field is not None and resistance_field is not None
+
+    # Case 5: Parse equipment voltage (unless the caller already did)
+    if equipment_voltage is None:
+        equipment_voltage = parse_float(equipment_field.value)
+    if equipment_voltage is None:
+        return [
+            Finding.model_construct(
                 rule_id=rule_id,
                 severity=FindingSeverity.WARNING,
-                message="Equipment voltage rating missing - cannot determine minimum insulation resistance requirement",
-                field_name="equipment_voltage_rating",
-                found_value=None,
-                expected_value="equipment voltage rating in volts",
-                location=None,
-            )
-        )
-        return findings
-
-    # Case 2: Missing or None value in equipment rating
-    if megger.equipment_voltage_rating.value is None:
-        findings.append(
-            Finding(
-                rule_id=rule_id,
-                severity=FindingSeverity.WARNING,
-                message="Equipment voltage rating value is empty - cannot determine minimum resistance",
-                field_name="equipment_voltage_rating",
-                found_value=None,
-                expected_value="equipment voltage rating in volts",
-                location=megger.equipment_voltage_rating.location,
-            )
-        )
-        return findings
-
-    # Case 3: Missing insulation resistance
-    if megger.insulation_resistance is None:
-        findings.append(
-            Finding(
-                rule_id=rule_id,
-                severity=FindingSeverity.WARNING,
-                message="Insulation resistance value missing - cannot validate minimum requirement",
-                field_name="insulation_resistance",
-                found_value=None,
-                expected_value="insulation resistance in megohms",
-                location=None,
-            )
-        )
-        return findings
-
-    # Case 4: Missing or None value in resistance
-    if megger.insulation_resistance.value is None:
-        findings.append(
-            Finding(
-                rule_id=rule_id,
-                severity=FindingSeverity.WARNING,
-                message="Insulation resistance value is empty - cannot validate minimum requirement",
-                field_name="insulation_resistance",
-                found_value=None,
-                expected_value="insulation resistance in megohms",
-                location=megger.insulation_resistance.location,
-            )
-        )
-        return findings
-
-    # Case 5: Parse equipment voltage
-    try:
-        equipment_voltage = float(megger.equipment_voltage_rating.value)
-    except (ValueError, TypeError):
-        findings.append(
-            Finding(
-                rule_id=rule_id,
-                severity=FindingSeverity.WARNING,
-                message=f"Could not parse equipment voltage rating '{megger.equipment_voltage_rating.value}' - manual review required",
-                field_name="equipment_voltage_rating",
-                found_value=megger.equipment_voltage_rating.value,
+                message=_MSG_UNPARSEABLE_RATING.format(value=equipment_field.value),
+                field_name=_FIELD_EQUIPMENT_VOLTAGE,
+                found_value=equipment_field.value,
                 expected_value="numeric voltage value",
-                location=megger.equipment_voltage_rating.location,
+                location=equipment_field.location,
             )
-        )
-        return findings
+        ]
 
     # Case 6: Parse insulation resistance
-    try:
-        resistance = float(megger.insulation_resistance.value)
-    except (ValueError, TypeError):
-        findings.append(
-            Finding(
+    resistance = parse_float(resistance_field.value)
+    if resistance is None:
+        return [
+            Finding.model_construct(
                 rule_id=rule_id,
                 severity=FindingSeverity.WARNING,
-                message=f"Could not parse insulation resistance '{megger.insulation_resistance.value}' - manual review required",
-                field_name="insulation_resistance",
-                found_value=megger.insulation_resistance.value,
+                message=_MSG_UNPARSEABLE_RESISTANCE.format(value=resistance_field.value),
+                field_name=_FIELD_INSULATION_RESISTANCE,
+                found_value=resistance_field.value,
                 expected_value="numeric resistance value in megohms",
-                location=megger.insulation_resistance.location,
+                location=resistance_field.location,
             )
-        )
-        return findings
+        ]
 
     # Case 7: Get minimum resistance for equipment voltage class
     min_resistance = _get_min_resistance(equipment_voltage)
     if min_resistance is None:
-        findings.append(
-            Finding(
+        return [
+            Finding.model_construct(
                 rule_id=rule_id,
                 severity=FindingSeverity.WARNING,
-                message=f"Unknown voltage class for equipment rated {equipment_voltage}V - manual review required",
-                field_name="equipment_voltage_rating",
+                message=_MSG_UNKNOWN_CLASS.format(equipment=equipment_voltage),
+                field_name=_FIELD_EQUIPMENT_VOLTAGE,
                 found_value=f"{equipment_voltage}V",
                 expected_value="standard voltage class",
-                location=megger.equipment_voltage_rating.location,
-            )
-        )
-        return findings
-
-    # Case 8: Resistance BELOW minimum - WARNING (not ERROR per zero false rejections)
-    if resistance < min_resistance:
-        findings.append(
-            Finding(
-                rule_id=rule_id,
-                severity=FindingSeverity.WARNING,
-                message=f"Insulation resistance {resistance} Mohm below minimum {min_resistance} Mohm for equipment rated {equipment_voltage}V - review required",
-                field_name="insulation_resistance",
-                found_value=f"{resistance} Mohm",
-                expected_value=f">= {min_resistance} Mohm",
-                location=megger.insulation_resistance.location,
+                location=equipment_field.location,
             )
-        )
-        return findings
+        ]
 
-    # Case 9: Resistance at or above minimum - INFO
-    findings.append(
-        Finding(
+    # Cases 8-9: Compare resistance against the class minimum
+    severity, message, found_value, expected_value = _classify_insulation(
+        equipment_voltage, resistance, min_resistance
+    )
+    return [
+        Finding.model_construct(
             rule_id=rule_id,
-            severity=FindingSeverity.INFO,
-            message=f"Insulation resistance {resistance} Mohm meets minimum requirement ({min_resistance} Mohm) for equipment rated {equipment_voltage}V",
-            field_name="insulation_resistance",
-            found_value=f"{resistance} Mohm",
-            expected_value=f">= {min_resistance} Mohm",
-            location=megger.insulation_resistance.location,
+            severity=severity,
+            message=message,
+            field_name=_FIELD_INSULATION_RESISTANCE,
+            found_value=found_value,
+            expected_value=expected_value,
+            location=resistance_field.location,
         )
-    )
-
-    return findings
+    ]
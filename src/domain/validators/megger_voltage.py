@@ -11,8 +11,35 @@ Core principle: Zero false rejections. When uncertain (missing/unparseable value
 use WARNING (REVIEW_NEEDED) instead of ERROR (REJECTED).
 """
 
+import math
+from bisect import bisect_left
+
 from src.domain.schemas.evidence import Finding, FindingSeverity
 from src.domain.schemas.extraction import MeggerData
+from src.domain.validators.numeric_parser import parse_float
+from src.domain.validators.required_fields import RequiredField, check_required_fields
+
+# Finding field names, shared by every finding this rule emits
+_FIELD_EQUIPMENT_VOLTAGE = "equipment_voltage_rating"
+_FIELD_TEST_VOLTAGE = "test_voltage"
+
+# Message templates (str.format), filled with the parsed voltages
+_MSG_UNPARSEABLE_RATING = (
+    "Could not parse equipment voltage rating '{value}' - manual review required"
+)
+_MSG_UNPARSEABLE_TEST = "Could not parse test voltage '{value}' - manual review required"
+_MSG_UNKNOWN_CLASS = (
+    "Unknown voltage class for equipment rated {equipment}V - manual review required"
+)
+_MSG_TOO_HIGH = (
+    "Test voltage {test}V too high for equipment rated {equipment}V "
+    "(max safe: {max_safe}V) - potential equipment damage"
+)
+_MSG_TOO_LOW = (
+    "Test voltage {test}V below recommended {recommended}V for equipment rated "
+    "{equipment}V - may not reveal insulation defects"
+)
+_MSG_APPROPRIATE = "Test voltage {test}V appropriate for equipment rated {equipment}V"
 
 # Test voltage ranges by equipment voltage class
 # Format: (max_equipment_voltage, recommended_test_voltage, max_safe_test_voltage)
@@ -23,6 +50,54 @@ VOLTAGE_CLASS_TEST_VOLTAGES = [
     (float('inf'), 2500, 5000),  # > 1000V: test at 2500V+, max 5000V
 ]
 
+# Parallel (structure-of-arrays) columns of VOLTAGE_CLASS_TEST_VOLTAGES.
+# bisect only scans the sorted boundaries; the other columns are indexed.
+_MAX_EQUIPMENT_VOLTAGES, _RECOMMENDED_TEST_VOLTAGES, _MAX_SAFE_TEST_VOLTAGES = (
+    tuple(column) for column in zip(*VOLTAGE_CLASS_TEST_VOLTAGES, strict=True)
+)
+
+# Fields that must be present before the test voltage can be checked
+_REQUIRED_FIELDS: tuple[RequiredField, ...] = (
+    (
+        _FIELD_EQUIPMENT_VOLTAGE,
+        "Equipment voltage rating missing - cannot validate test voltage appropriateness",
+        "Equipment voltage rating value is empty - cannot validate test voltage",
+        "equipment voltage rating in volts",
+    ),
+    (
+        _FIELD_TEST_VOLTAGE,
+        "Test voltage missing - cannot validate voltage appropriateness",
+        "Test voltage value is empty - cannot validate voltage appropriateness",
+        "test voltage in volts",
+    ),
+)
+
+
+def _compute_voltage_class(equipment_voltage: float) -> tuple[float, float, float] | None:
+    """Search the voltage class table for given equipment voltage.
+
+    Returns tuple of (max_equipment_voltage, recommended_test_voltage, max_safe_test_voltage)
+    or None if not found.
+    """
+    if math.isnan(equipment_voltage):
+        return None
+    idx = bisect_left(_MAX_EQUIPMENT_VOLTAGES, equipment_voltage)
+    if idx == len(_MAX_EQUIPMENT_VOLTAGES):
+        return None
+    return (
+        _MAX_EQUIPMENT_VOLTAGES[idx],
+        _RECOMMENDED_TEST_VOLTAGES[idx],
+        _MAX_SAFE_TEST_VOLTAGES[idx],
+    )
+
+
+# Precomputed classes for every whole-volt rating up to 5 kV. Only whole-volt
+# ratings are looked up here; a fractional rating such as 250.5 falls back to
+# the search (int() truncation would wrongly put it in the 250V class).
+_VOLTAGE_TO_CLASS: dict[int, tuple[float, float, float] | None] = {
+    voltage: _compute_voltage_class(float(voltage)) for voltage in range(0, 5001)
+}
+
 
 def _get_voltage_class(equipment_voltage: float) -> tuple[float, float, float] | None:
     """Get the voltage class parameters for given equipment voltage.
@@ -30,15 +105,19 @@ def _get_voltage_class(equipment_voltage: float) -> tuple[float, float, float] |
     Returns tuple of (max_equipment_voltage, recommended_test_voltage, max_safe_test_voltage)
     or None if not found.
     """
-    for max_equip, recommended, max_safe in VOLTAGE_CLASS_TEST_VOLTAGES:
-        if equipment_voltage <= max_equip:
-            return (max_equip, recommended, max_safe)
-    return None
+    voltage_class = None
+    if equipment_voltage % 1 == 0:  # whole volts; false for NaN and inf
+        voltage_class = _VOLTAGE_TO_CLASS.get(int(equipment_voltage))
+    if voltage_class is None:
+        return _compute_voltage_class(equipment_voltage)
+    return voltage_class
 
 
 def validate_test_voltage(
     megger: MeggerData,
     rule_id: str = "MEGGER-02",
+    *,
+    equipment_voltage: float | None = None,
 ) -> list[Finding]:
     """Validate test voltage appropriateness for equipment rating.
 
@@ -48,6 +127,8 @@ def validate_test_voltage(
     Args:
         megger: Megger test data containing equipment rating and test voltage.
         rule_id: Validation rule identifier for tracing.
+        equipment_voltage: Equipment voltage rating already parsed by the caller
+            (see validate_megger_all). Parsed from megger when None.
 
     Returns:
         List of findings based on voltage appropriateness:
@@ -56,161 +137,106 @@ def validate_test_voltage(
         - INFO if test voltage appropriate
         - WARNING if values are missing/unparseable
     """
-    findings: list[Finding] = []
-
-    # Case 1: Missing equipment voltage rating
-    if megger.equipment_voltage_rating is None:
-        findings.append(
-            Finding(
+    # Cases 1-4: Missing equipment voltage rating or test voltage
+    missing_findings = check_required_fields(megger, _REQUIRED_FIELDS, rule_id)
+    if missing_findings is not None:
+        return missing_findings
+
+    # Both fields were checked above; bind them narrowed to ExtractedField
+    equipment_field = megger.equipment_voltage_rating
+    test_field = megger.test_voltage
+    assert equipment_field is not None and test_field is not None
+
+    # Case 5: Parse equipment voltage (unless the caller already did)
+    if equipment_voltage is None:
+        equipment_voltage = parse_float(equipment_field.value)
+    if equipment_voltage is None:
+        return [
+            Finding.model_construct(
                 rule_id=rule_id,
                 severity=FindingSeverity.WARNING,
-                message="Equipment voltage rating missing - cannot validate test voltage appropriateness",
-                field_name="equipment_voltage_rating",
-                found_value=None,
-                expected_value="equipment voltage rating in volts",
-                location=None,
-            )
-        )
-        return findings
-
-    # Case 2: Missing or None value in equipment rating
-    if megger.equipment_voltage_rating.value is None:
-        findings.append(
-            Finding(
-                rule_id=rule_id,
-                severity=FindingSeverity.WARNING,
-                message="Equipment voltage rating value is empty - cannot validate test voltage",
-                field_name="equipment_voltage_rating",
-                found_value=None,
-                expected_value="equipment voltage rating in volts",
-                location=megger.equipment_voltage_rating.location,
-            )
-        )
-        return findings
-
-    # Case 3: Missing test voltage
-    if megger.test_voltage is None:
-        findings.append(
-            Finding(
-                rule_id=rule_id,
-                severity=FindingSeverity.WARNING,
-                message="Test voltage missing - cannot validate voltage appropriateness",
-                field_name="test_voltage",
-                found_value=None,
-                expected_value="test voltage in volts",
-                location=None,
-            )
-        )
-        return findings
-
-    # Case 4: Missing or None value in test voltage
-    if megger.test_voltage.value is None:
-        findings.append(
-            Finding(
-                rule_id=rule_id,
-                severity=FindingSeverity.WARNING,
-                message="Test voltage value is empty - cannot validate voltage appropriateness",
-                field_name="test_voltage",
-                found_value=None,
-                expected_value="test voltage in volts",
-                location=megger.test_voltage.location,
-            )
-        )
-        return findings
-
-    # Case 5: Parse equipment voltage
-    try:
-        equipment_voltage = float(megger.equipment_voltage_rating.value)
-    except (ValueError, TypeError):
-        findings.append(
-            Finding(
-                rule_id=rule_id,
-                severity=FindingSeverity.WARNING,
-                message=f"Could not parse equipment voltage rating '{megger.equipment_voltage_rating.value}' - manual review required",
-                field_name="equipment_voltage_rating",
-                found_value=megger.equipment_voltage_rating.value,
+                message=_MSG_UNPARSEABLE_RATING.format(value=equipment_field.value),
+                field_name=_FIELD_EQUIPMENT_VOLTAGE,
+                found_value=equipment_field.value,
                 expected_value="numeric voltage value",
-                location=megger.equipment_voltage_rating.location,
+                location=equipment_field.location,
             )
-        )
-        return findings
+        ]
 
     # Case 6: Parse test voltage
-    try:
-        test_voltage = float(megger.test_voltage.value)
-    except (ValueError, TypeError):
-        findings.append(
-            Finding(
+    test_voltage = parse_float(test_field.value)
+    if test_voltage is None:
+        return [
+            Finding.model_construct(
                 rule_id=rule_id,
                 severity=FindingSeverity.WARNING,
-                message=f"Could not parse test voltage '{megger.test_voltage.value}' - manual review required",
-                field_name="test_voltage",
-                found_value=megger.test_voltage.value,
+                message=_MSG_UNPARSEABLE_TEST.format(value=test_field.value),
+                field_name=_FIELD_TEST_VOLTAGE,
+                found_value=test_field.value,
                 expected_value="numeric voltage value",
-                location=megger.test_voltage.location,
+                location=test_field.location,
             )
-        )
-        return findings
+        ]
 
     # Case 7: Get voltage class for equipment
     voltage_class = _get_voltage_class(equipment_voltage)
     if voltage_class is None:
-        findings.append(
-            Finding(
+        return [
+            Finding.model_construct(
                 rule_id=rule_id,
                 severity=FindingSeverity.WARNING,
-                message=f"Unknown voltage class for equipment rated {equipment_voltage}V - manual review required",
-                field_name="equipment_voltage_rating",
+                message=_MSG_UNKNOWN_CLASS.format(equipment=equipment_voltage),
+                field_name=_FIELD_EQUIPMENT_VOLTAGE,
                 found_value=f"{equipment_voltage}V",
                 expected_value="standard voltage class",
-                location=megger.equipment_voltage_rating.location,
+                location=equipment_field.location,
             )
-        )
-        return findings
+        ]
 
     max_equip, recommended_test, max_safe_test = voltage_class
+    found_value = f"{test_voltage}V"
 
     # Case 8: Test voltage too HIGH - ERROR (could damage equipment)
     if test_voltage > max_safe_test:
-        findings.append(
-            Finding(
+        return [
+            Finding.model_construct(
                 rule_id=rule_id,
                 severity=FindingSeverity.ERROR,
-                message=f"Test voltage {test_voltage}V too high for equipment rated {equipment_voltage}V (max safe: {max_safe_test}V) - potential equipment damage",
-                field_name="test_voltage",
-                found_value=f"{test_voltage}V",
+                message=_MSG_TOO_HIGH.format(
+                    test=test_voltage, equipment=equipment_voltage, max_safe=max_safe_test
+                ),
+                field_name=_FIELD_TEST_VOLTAGE,
+                found_value=found_value,
                 expected_value=f"<= {max_safe_test}V",
-                location=megger.test_voltage.location,
+                location=test_field.location,
             )
-        )
-        return findings
+        ]
 
     # Case 9: Test voltage too LOW - WARNING (might miss issues)
     if test_voltage < recommended_test:
-        findings.append(
-            Finding(
+        return [
+            Finding.model_construct(
                 rule_id=rule_id,
                 severity=FindingSeverity.WARNING,
-                message=f"Test voltage {test_voltage}V below recommended {recommended_test}V for equipment rated {equipment_voltage}V - may not reveal insulation defects",
-                field_name="test_voltage",
-                found_value=f"{test_voltage}V",
+                message=_MSG_TOO_LOW.format(
+                    test=test_voltage, recommended=recommended_test, equipment=equipment_voltage
+                ),
+                field_name=_FIELD_TEST_VOLTAGE,
+                found_value=found_value,
                 expected_value=f">= {recommended_test}V",
-                location=megger.test_voltage.location,
+                location=test_field.location,
             )
-        )
-        return findings
+        ]
 
     # Case 10: Test voltage appropriate - INFO
-    findings.append(
-        Finding(
+    return [
+        Finding.model_construct(
             rule_id=rule_id,
             severity=FindingSeverity.INFO,
-            message=f"Test voltage {test_voltage}V appropriate for equipment rated {equipment_voltage}V",
-            field_name="test_voltage",
-            found_value=f"{test_voltage}V",
+            message=_MSG_APPROPRIATE.format(test=test_voltage, equipment=equipment_voltage),
+            field_name=_FIELD_TEST_VOLTAGE,
+            found_value=found_value,
             expected_value=f"{recommended_test}V - {max_safe_test}V",
-            location=megger.test_voltage.location,
+            location=test_field.location,
         )
-    )
-
-    return findings
+    ]
@@ -0,0 +1,42 @@
+"""Numeric value parser for AuditEng V2.
+
+Parses measurement strings (voltages, resistances) extracted from reports.
+Uses a precompiled pattern instead of exception-driven float() parsing, so
+unparseable values cost a regex miss rather than a raised ValueError.
+
+Accepted forms mirror float(): optional surrounding whitespace, optional sign,
+decimal or exponent notation, underscore digit grouping, and inf/nan.
+
+Results are memoized by string: MEGGER-02 and MEGGER-03 both parse the
+same equipment voltage rating, so the second rule reuses the first parse.
+"""
+
+import re
+from functools import lru_cache
+
+# Digit run, optionally grouped with single underscores as float() allows
+_DIGITS = r"\d+(?:_\d+)*"
+
+_NUMERIC_PATTERN = re.compile(
+    rf"^\s*[+-]?(?:(?:{_DIGITS}(?:\.(?:{_DIGITS})?)?|\.{_DIGITS})(?:[eE][+-]?{_DIGITS})?"
+    r"|inf(?:inity)?|nan)\s*$",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=256)
+def parse_float(value: str) -> float | None:
+    """Parse a numeric string into a float.
+
+    Args:
+        value: Raw numeric string from extraction.
+
+    Returns:
+        Parsed float, or None if the value is not numeric.
+
+    Note:
+        Does NOT raise exceptions. Returns None for any unparseable input.
+    """
+    if _NUMERIC_PATTERN.match(value) is None:
+        return None
+    return float(value)
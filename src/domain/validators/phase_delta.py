@@ -19,6 +19,42 @@ from src.domain.schemas.extraction import MeasurementReading
 DELTA_WARNING_THRESHOLD = 3.0  # > 3C requires review
 DELTA_ERROR_THRESHOLD = 15.0   # > 15C is critical failure
 
+# Expected-value strings only depend on the thresholds
+_EXPECTED_NORMAL = f"<= {DELTA_WARNING_THRESHOLD}C"
+_EXPECTED_CRITICAL = f"<= {DELTA_ERROR_THRESHOLD}C"
+
+
+def _skipped_finding(rule_id: str, message: str, valid_count: int) -> Finding:
+    """Build the INFO finding for a check skipped on too few readings."""
+    return Finding(
+        rule_id=rule_id,
+        severity=FindingSeverity.INFO,
+        message=message,
+        field_name="phase_temperatures",
+        found_value=str(valid_count),
+        expected_value=">= 2",
+        location=None,
+    )
+
+
+def _delta_finding(
+    rule_id: str,
+    severity: FindingSeverity,
+    message: str,
+    delta: float,
+    expected_value: str,
+) -> Finding:
+    """Build the finding for an evaluated phase delta."""
+    return Finding(
+        rule_id=rule_id,
+        severity=severity,
+        message=message,
+        field_name="phase_delta",
+        found_value=f"{delta:.1f}C",
+        expected_value=expected_value,
+        location=None,
+    )
+
 
 def validate_phase_delta(
     phase_readings: list[MeasurementReading],
@@ -46,118 +82,117 @@ def validate_phase_delta(
     # Case 1: Insufficient data (need at least 2 phases to calculate delta)
     if len(phase_readings) < 2:
         findings.append(
-            Finding(
-                rule_id=rule_id,
-                severity=FindingSeverity.INFO,
-                message="Phase delta check skipped - insufficient data (need at least 2 phase readings)",
-                field_name="phase_temperatures",
-                found_value=str(len(phase_readings)),
-                expected_value=">= 2",
-                location=None,
+            _skipped_finding(
+                rule_id,
+                "Phase delta check skipped - insufficient data (need at least 2 phase readings)",
+                len(phase_readings),
             )
         )
         return findings
 
-    # Case 2: Extract and parse temperature values
-    temperatures: list[float] = []
-    phase_labels: list[str] = []
-    unparseable_phases: list[str] = []
+    # Case 2: Extract and parse temperature values, tracking the hottest and
+    # coldest phase in the same pass (first phase wins on ties)
+    valid_count = 0
+    max_temp = min_temp = 0.0
+    max_phase = min_phase = ""
+    # Only allocated once a reading fails to parse
+    unparseable_phases: list[str] | None = None
 
     for reading in phase_readings:
         label = reading.location_label
 
-        # Check for None value
-        if reading.value is None or reading.value.value is None:
+        # None value or non-numeric text both leave temp unset
+        raw_value = reading.value.value if reading.value is not None else None
+        temp: float | None = None
+        if raw_value is not None:
+            try:
+                temp = float(raw_value)
+            except (ValueError, TypeError):
+                pass
+
+        if temp is None:
+            if unparseable_phases is None:
+                unparseable_phases = []
             unparseable_phases.append(label)
             continue
 
-        # Try to parse the value as float
-        raw_value = reading.value.value
-        try:
-            temp = float(raw_value)
-            temperatures.append(temp)
-            phase_labels.append(label)
-        except (ValueError, TypeError):
-            unparseable_phases.append(label)
+        if valid_count == 0:
+            max_temp = min_temp = temp
+            max_phase = min_phase = label
+        elif temp > max_temp:
+            max_temp, max_phase = temp, label
+        elif temp < min_temp:
+            min_temp, min_phase = temp, label
+        valid_count += 1
 
     # Case 3: Report unparseable values as WARNING
-    if unparseable_phases:
+    if unparseable_phases is not None:
+        unparseable_str = ", ".join(unparseable_phases)
         findings.append(
             Finding(
                 rule_id=rule_id,
                 severity=FindingSeverity.WARNING,
-                message=f"Could not parse temperature value(s) for phase(s): {', '.join(unparseable_phases)} - manual review required",
+                message=(
+                    "Could not parse temperature value(s) for phase(s): "
+                    f"{unparseable_str} - manual review required"
+                ),
                 field_name="phase_temperatures",
-                found_value=", ".join(unparseable_phases),
+                found_value=unparseable_str,
                 expected_value="numeric temperature value",
                 location=None,
             )
         )
 
     # Case 4: Check if we have enough valid temperatures after parsing
-    if len(temperatures) < 2:
+    if valid_count < 2:
         # If we already reported unparseable, don't add another finding
         if not findings:
             findings.append(
-                Finding(
-                    rule_id=rule_id,
-                    severity=FindingSeverity.INFO,
-                    message="Phase delta check skipped - insufficient valid temperature data",
-                    field_name="phase_temperatures",
-                    found_value=str(len(temperatures)),
-                    expected_value=">= 2",
-                    location=None,
+                _skipped_finding(
+                    rule_id,
+                    "Phase delta check skipped - insufficient valid temperature data",
+                    valid_count,
                 )
             )
         return findings
 
     # Case 5: Calculate delta (max - min)
-    max_temp = max(temperatures)
-    min_temp = min(temperatures)
     delta = max_temp - min_temp
 
-    # Find which phases have max and min temperatures for traceability
-    max_phase = phase_labels[temperatures.index(max_temp)]
-    min_phase = phase_labels[temperatures.index(min_temp)]
-
     # Case 6: Evaluate against thresholds
     if delta > DELTA_ERROR_THRESHOLD:
         # Critical failure - ERROR
         findings.append(
-            Finding(
-                rule_id=rule_id,
-                severity=FindingSeverity.ERROR,
-                message=f"Phase delta {delta:.1f}C exceeds critical threshold of {DELTA_ERROR_THRESHOLD}C ({max_phase}: {max_temp}C, {min_phase}: {min_temp}C)",
-                field_name="phase_delta",
-                found_value=f"{delta:.1f}C",
-                expected_value=f"<= {DELTA_ERROR_THRESHOLD}C",
-                location=None,
+            _delta_finding(
+                rule_id,
+                FindingSeverity.ERROR,
+                f"Phase delta {delta:.1f}C exceeds critical threshold of {DELTA_ERROR_THRESHOLD}C "
+                f"({max_phase}: {max_temp}C, {min_phase}: {min_temp}C)",
+                delta,
+                _EXPECTED_CRITICAL,
             )
         )
     elif delta > DELTA_WARNING_THRESHOLD:
         # Requires review - WARNING
         findings.append(
-            Finding(
-                rule_id=rule_id,
-                severity=FindingSeverity.WARNING,
-                message=f"Phase delta {delta:.1f}C exceeds review threshold of {DELTA_WARNING_THRESHOLD}C ({max_phase}: {max_temp}C, {min_phase}: {min_temp}C)",
-                field_name="phase_delta",
-                found_value=f"{delta:.1f}C",
-                expected_value=f"<= {DELTA_WARNING_THRESHOLD}C",
-                location=None,
+            _delta_finding(
+                rule_id,
+                FindingSeverity.WARNING,
+                f"Phase delta {delta:.1f}C exceeds review threshold of {DELTA_WARNING_THRESHOLD}C "
+                f"({max_phase}: {max_temp}C, {min_phase}: {min_temp}C)",
+                delta,
+                _EXPECTED_NORMAL,
             )
         )
     else:
         # Normal operation - INFO
         findings.append(
-            Finding(
-                rule_id=rule_id,
-                severity=FindingSeverity.INFO,
-                message=f"Phase delta {delta:.1f}C within normal range (<= {DELTA_WARNING_THRESHOLD}C)",
-                field_name="phase_delta",
-                found_value=f"{delta:.1f}C",
-                expected_value=f"<= {DELTA_WARNING_THRESHOLD}C",
-                location=None,
+            _delta_finding(
+                rule_id,
+                FindingSeverity.INFO,
+                f"Phase delta {delta:.1f}C within normal range ({_EXPECTED_NORMAL})",
+                delta,
+                _EXPECTED_NORMAL,
             )
         )
 
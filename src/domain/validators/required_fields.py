@@ -0,0 +1,78 @@
+"""Required field preflight for AuditEng V2 validators.
+
+Validators that need several ExtractedField values before they can evaluate
+a rule share the same "missing field -> WARNING" ladder. This module runs
+that ladder from a table so each validator only declares its requirements.
+
+Core principle: Zero false rejections. Missing data is WARNING (REVIEW_NEEDED).
+"""
+
+from functools import lru_cache
+
+from pydantic import BaseModel
+
+from src.domain.schemas.evidence import Finding, FindingSeverity
+from src.domain.schemas.extraction import ExtractedField
+
+# Format: (field_name, missing_message, empty_message, expected_value)
+RequiredField = tuple[str, str, str, str]
+
+
+@lru_cache(maxsize=64)
+def _missing_field_finding(
+    rule_id: str,
+    field_name: str,
+    message: str,
+    expected_value: str,
+) -> Finding:
+    """Build the WARNING finding for an absent field.
+
+    Has no location or found value, so one instance per rule/field is reused.
+    """
+    return Finding.model_construct(
+        rule_id=rule_id,
+        severity=FindingSeverity.WARNING,
+        message=message,
+        field_name=field_name,
+        found_value=None,
+        expected_value=expected_value,
+        location=None,
+    )
+
+
+def check_required_fields(
+    data: BaseModel,
+    required: tuple[RequiredField, ...],
+    rule_id: str,
+) -> list[Finding] | None:
+    """Check that every required field is present and has a value.
+
+    Fields are checked in table order; the first field that is missing
+    (attribute is None) or empty (value is None) produces a WARNING.
+
+    Args:
+        data: Extracted test data (e.g., MeggerData) holding ExtractedField attributes.
+        required: Table of required fields and their finding messages.
+        rule_id: Validation rule identifier for tracing.
+
+    Returns:
+        List with a single WARNING finding for the first missing/empty field,
+        or None if all required fields have values.
+    """
+    for field_name, missing_message, empty_message, expected_value in required:
+        field: ExtractedField | None = getattr(data, field_name)
+        if field is None:
+            return [_missing_field_finding(rule_id, field_name, missing_message, expected_value)]
+        if field.value is None:
+            return [
+                Finding.model_construct(
+                    rule_id=rule_id,
+                    severity=FindingSeverity.WARNING,
+                    message=empty_message,
+                    field_name=field_name,
+                    found_value=None,
+                    expected_value=expected_value,
+                    location=field.location,
+                )
+            ]
+    return None
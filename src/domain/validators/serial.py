@@ -8,7 +8,38 @@ Mismatches indicate potential copy-paste errors or document tampering.
 """
 
 from src.domain.schemas.evidence import Finding, FindingSeverity
-from src.domain.schemas.extraction import CalibrationInfo, ExtractionResult, ExtractedField
+from src.domain.schemas.extraction import (
+    CalibrationInfo,
+    ExtractionResult,
+    ExtractedField,
+    FieldLocation,
+)
+
+
+def _location_key(location: FieldLocation | None) -> tuple | None:
+    """Hashable identity of a field location (FieldLocation itself is unhashable)."""
+    if location is None:
+        return None
+    bbox = location.bbox
+    return (location.page, bbox.left, bbox.top, bbox.right, bbox.bottom, location.chunk_id)
+
+
+def _skipped_finding(
+    rule_id: str,
+    message: str,
+    found_value: str | None = None,
+    location: FieldLocation | None = None,
+) -> Finding:
+    """Build the INFO finding for a consistency check skipped on too little data."""
+    return Finding(
+        rule_id=rule_id,
+        severity=FindingSeverity.INFO,
+        message=message,
+        field_name="serial_number",
+        found_value=found_value,
+        expected_value=None,
+        location=location,
+    )
 
 
 def validate_serial_consistency(
@@ -36,61 +67,54 @@ def validate_serial_consistency(
     # Case 1: Insufficient data for cross-validation
     if len(serial_numbers) < 2:
         findings.append(
-            Finding(
-                rule_id=rule_id,
-                severity=FindingSeverity.INFO,
-                message="Serial number consistency check skipped (insufficient data)",
-                field_name="serial_number",
+            _skipped_finding(
+                rule_id,
+                "Serial number consistency check skipped (insufficient data)",
                 found_value=serial_numbers[0].value if serial_numbers else None,
-                expected_value=None,
                 location=serial_numbers[0].location if serial_numbers else None,
             )
         )
         return findings
 
-    # Extract and normalize values, filtering out None
-    normalized_serials: list[tuple[str, ExtractedField]] = []
+    # Normalize values, filtering out None. Maps each unique normalized serial
+    # to the first field it was seen in (dict order = document order).
+    unique: dict[str, ExtractedField] = {}
+    valid_count = 0
     for field in serial_numbers:
         if field.value is not None:
-            normalized = field.value.strip().upper()
-            normalized_serials.append((normalized, field))
+            valid_count += 1
+            unique.setdefault(field.value.strip().upper(), field)
 
     # If all values were None, skip check
-    if len(normalized_serials) < 2:
+    if valid_count < 2:
         findings.append(
-            Finding(
-                rule_id=rule_id,
-                severity=FindingSeverity.INFO,
-                message="Serial number consistency check skipped (insufficient valid values)",
-                field_name="serial_number",
-                found_value=None,
-                expected_value=None,
-                location=None,
+            _skipped_finding(
+                rule_id,
+                "Serial number consistency check skipped (insufficient valid values)",
             )
         )
         return findings
 
-    # Get unique normalized values
-    unique_values = set(norm for norm, _ in normalized_serials)
+    first_field = next(iter(unique.values()))
 
     # Case 2: All serial numbers match
-    if len(unique_values) == 1:
-        serial_value = next(iter(unique_values))
+    if len(unique) == 1:
+        serial_value = next(iter(unique))
         findings.append(
             Finding(
                 rule_id=rule_id,
                 severity=FindingSeverity.INFO,
-                message=f"Serial numbers consistent: {serial_value} (found in {len(normalized_serials)} locations)",
+                message=f"Serial numbers consistent: {serial_value} (found in {valid_count} locations)",
                 field_name="serial_number",
                 found_value=serial_value,
                 expected_value=None,
-                location=normalized_serials[0][1].location,
+                location=first_field.location,
             )
         )
         return findings
 
     # Case 3: Serial number mismatch detected
-    unique_values_str = ", ".join(sorted(unique_values))
+    unique_values_str = ", ".join(sorted(unique))
     findings.append(
         Finding(
             rule_id=rule_id,
@@ -99,12 +123,21 @@ def validate_serial_consistency(
             field_name="serial_number",
             found_value=unique_values_str,
             expected_value="All serial numbers should match",
-            location=normalized_serials[0][1].location,
+            location=first_field.location,
         )
     )
 
-    # Add supplementary findings for each serial number location
-    for norm_value, field in normalized_serials:
+    # Add supplementary findings for each distinct (serial, location) pair;
+    # a serial repeated at the same location is reported once
+    seen: set[tuple[str, tuple | None]] = set()
+    for field in serial_numbers:
+        if field.value is None:
+            continue
+        norm_value = field.value.strip().upper()
+        key = (norm_value, _location_key(field.location))
+        if key in seen:
+            continue
+        seen.add(key)
         findings.append(
             Finding(
                 rule_id=rule_id,
@@ -133,10 +166,8 @@ def collect_serial_numbers(extraction: ExtractionResult) -> list[ExtractedField]
         List of ExtractedField objects containing serial numbers.
         Empty list if no calibrations or no serial numbers found.
     """
-    serial_numbers: list[ExtractedField] = []
-
-    for calibration in extraction.calibrations:
-        if calibration.serial_number is not None:
-            serial_numbers.append(calibration.serial_number)
-
-    return serial_numbers
+    return [
+        calibration.serial_number
+        for calibration in extraction.calibrations
+        if calibration.serial_number is not None
+    ]
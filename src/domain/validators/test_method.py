@@ -15,9 +15,15 @@ missing context), use WARNING (REVIEW_NEEDED) instead of ERROR (REJECTED).
 Exception: Missing test method is ERROR since method traceability is required.
 """
 
+from functools import lru_cache
+
 from src.domain.schemas.evidence import Finding, FindingSeverity
 from src.domain.schemas.extraction import GroundingData
 
+# Expected-value strings shared by several findings
+_EXPECTED_DOCUMENTED = "Documented test method (e.g., fall-of-potential, clamp-on)"
+_EXPECTED_CONTEXT = "Installation type context (new or existing)"
+
 # Valid methods with context restrictions and aliases
 # Format: method_key -> {"aliases": [...], "new_ok": bool, "existing_ok": bool}
 VALID_TEST_METHODS: dict[str, dict] = {
@@ -49,6 +55,7 @@ VALID_TEST_METHODS: dict[str, dict] = {
 }
 
 
+@lru_cache(maxsize=256)
 def _normalize_method(method: str) -> str:
     """Normalize method string for matching.
 
@@ -63,6 +70,23 @@ def _normalize_method(method: str) -> str:
     return method.lower().strip().replace(" ", "-")
 
 
+def _build_alias_index() -> dict[str, str]:
+    """Map every primary key and normalized alias to its canonical method key.
+
+    Primary keys take precedence; for aliases shared between methods the
+    first method in VALID_TEST_METHODS wins.
+    """
+    index = {method_key: method_key for method_key in VALID_TEST_METHODS}
+    for method_key, info in VALID_TEST_METHODS.items():
+        for alias in info["aliases"]:
+            index.setdefault(_normalize_method(alias), method_key)
+    return index
+
+
+# Built once at import; VALID_TEST_METHODS does not change at runtime
+_ALIAS_INDEX = _build_alias_index()
+
+
 def _find_method_key(normalized_method: str) -> str | None:
     """Find the canonical method key for a normalized method string.
 
@@ -74,18 +98,7 @@ def _find_method_key(normalized_method: str) -> str | None:
     Returns:
         Canonical method key if found, None otherwise.
     """
-    # Check if it matches a primary key
-    if normalized_method in VALID_TEST_METHODS:
-        return normalized_method
-
-    # Check aliases
-    for method_key, info in VALID_TEST_METHODS.items():
-        # Normalize aliases for comparison
-        normalized_aliases = [_normalize_method(alias) for alias in info["aliases"]]
-        if normalized_method in normalized_aliases:
-            return method_key
-
-    return None
+    return _ALIAS_INDEX.get(normalized_method)
 
 
 def validate_test_method(
@@ -122,7 +135,7 @@ def validate_test_method(
                 message="Test method not specified - must be documented for audit traceability",
                 field_name="test_method",
                 found_value=None,
-                expected_value="Documented test method (e.g., fall-of-potential, clamp-on)",
+                expected_value=_EXPECTED_DOCUMENTED,
                 location=None,
             )
         )
@@ -138,7 +151,7 @@ def validate_test_method(
                 message="Test method value is empty - must be documented for audit traceability",
                 field_name="test_method",
                 found_value=repr(raw_method),
-                expected_value="Documented test method (e.g., fall-of-potential, clamp-on)",
+                expected_value=_EXPECTED_DOCUMENTED,
                 location=grounding.test_method.location,
             )
         )
@@ -164,8 +177,6 @@ def validate_test_method(
         return findings
 
     # Method is recognized, now check context
-    method_info = VALID_TEST_METHODS[method_key]
-
     # Case 4: Check if installation context is specified
     if grounding.installation_type is None:
         findings.append(
@@ -175,15 +186,16 @@ def validate_test_method(
                 message=f"Test method '{method_key}' is valid but installation type context is missing - cannot verify method appropriateness",
                 field_name="test_method",
                 found_value=method_key,
-                expected_value="Installation type context (new or existing)",
+                expected_value=_EXPECTED_CONTEXT,
                 location=grounding.test_method.location,
             )
         )
         return findings
 
-    # Case 5: Check if context value is valid
+    # Case 5: Check if context value is valid (normalized once for Case 6)
     raw_context = grounding.installation_type.value
-    if raw_context is None or raw_context.strip() == "":
+    normalized_context = raw_context.lower().strip() if raw_context is not None else ""
+    if not normalized_context:
         findings.append(
             Finding(
                 rule_id=rule_id,
@@ -191,16 +203,14 @@ def validate_test_method(
                 message=f"Test method '{method_key}' is valid but installation type context is empty - cannot verify method appropriateness",
                 field_name="test_method",
                 found_value=method_key,
-                expected_value="Installation type context (new or existing)",
+                expected_value=_EXPECTED_CONTEXT,
                 location=grounding.test_method.location,
             )
         )
         return findings
 
-    # Normalize context
-    normalized_context = raw_context.lower().strip()
-
     # Case 6: Check context appropriateness
+    method_info = VALID_TEST_METHODS[method_key]
     if normalized_context == "new":
         if not method_info["new_ok"]:
             findings.append(
@@ -1,12 +1,16 @@
 """LandingAI ADE extraction service for PDF documents."""
 
+import asyncio
 import logging
 import os
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from landingai_ade import LandingAIADE
+from landingai_ade.lib import pydantic_to_json_schema
 from pydantic import BaseModel, Field
 
 from src.domain.schemas.extraction import (
@@ -20,6 +24,24 @@ from src.domain.schemas.extraction import (
 
 logger = logging.getLogger(__name__)
 
+# Cap on documents in flight against LandingAI at once (API rate limits).
+_EXTRACT_CONCURRENCY = int(os.environ.get("LANDINGAI_CONCURRENCY", "4"))
+
+# One semaphore per event loop. A semaphore binds to the first loop that has
+# to wait on it and then fails on any other, so it cannot live at module scope.
+_extract_semaphores: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    WeakKeyDictionary()
+)
+
+
+def _extract_semaphore() -> asyncio.Semaphore:
+    """Return the extraction semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _extract_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _extract_semaphores[loop] = asyncio.Semaphore(_EXTRACT_CONCURRENCY)
+    return semaphore
+
 
 # Extraction schema for commissioning reports
 class CommissioningReportSchema(BaseModel):
@@ -59,8 +81,26 @@ class CommissioningReportSchema(BaseModel):
     )
 
 
+# LandingAI model versions
+_PARSE_MODEL = "dpt-2-latest"
+_EXTRACT_MODEL = "extract-latest"
+
+# JSON schema sent with every extract call; the model never changes at runtime.
+# pydantic_to_json_schema already returns the serialized JSON string the SDK
+# sends, so there is no per-call serialization left to cache.
+_REPORT_SCHEMA = pydantic_to_json_schema(CommissioningReportSchema)
+
+# Invariant keyword arguments for client.extract; only the markdown varies
+_EXTRACT_KWARGS: dict[str, Any] = {"schema": _REPORT_SCHEMA, "model": _EXTRACT_MODEL}
+
+
+@lru_cache(maxsize=1)
 def get_client() -> LandingAIADE:
-    """Get LandingAI ADE client."""
+    """Get the shared LandingAI ADE client.
+
+    Built once per process; call get_client.cache_clear() after changing
+    VISION_AGENT_API_KEY.
+    """
     api_key = os.environ.get("VISION_AGENT_API_KEY")
     if not api_key:
         raise ValueError("VISION_AGENT_API_KEY environment variable not set")
@@ -77,34 +117,48 @@ def _parse_grounding(grounding: Any, chunk_id: str | None = None) -> FieldLocati
     if not grounding:
         return None
 
-    # LandingAI returns Pydantic objects, access attributes directly
-    box = grounding.box if hasattr(grounding, 'box') else None
+    # LandingAI returns Pydantic objects; getattr defaults cover missing attributes
+    box = getattr(grounding, "box", None)
     if not box:
         return None
 
     return FieldLocation(
-        page=grounding.page if hasattr(grounding, 'page') else 0,
+        page=getattr(grounding, "page", 0),
         bbox=BoundingBox(
-            left=box.left if hasattr(box, 'left') else 0,
-            top=box.top if hasattr(box, 'top') else 0,
-            right=box.right if hasattr(box, 'right') else 0,
-            bottom=box.bottom if hasattr(box, 'bottom') else 0,
+            left=getattr(box, "left", 0),
+            top=getattr(box, "top", 0),
+            right=getattr(box, "right", 0),
+            bottom=getattr(box, "bottom", 0),
         ),
         chunk_id=chunk_id,
     )
 
 
+def _index_chunks(chunks: list[Any]) -> dict[str, Any]:
+    """Index LandingAI chunks by id, keeping the first chunk for a repeated id.
+
+    Args:
+        chunks: List of Chunk objects from LandingAI parse response
+    """
+    chunks_by_id: dict[str, Any] = {}
+    for chunk in chunks:
+        chunk_id = getattr(chunk, "id", None)
+        if chunk_id is not None:
+            chunks_by_id.setdefault(chunk_id, chunk)
+    return chunks_by_id
+
+
 def _find_field_location(
     field_name: str,
     extraction_metadata: dict[str, Any],
-    chunks: list[Any],
+    chunks_by_id: dict[str, Any],
 ) -> FieldLocation | None:
     """Find location of extracted field using metadata references.
 
     Args:
         field_name: Name of the field to find location for
         extraction_metadata: Metadata dict from LandingAI extract response
-        chunks: List of Chunk objects from LandingAI parse response
+        chunks_by_id: Chunks from LandingAI parse response, keyed by id
     """
     field_meta = extraction_metadata.get(field_name, {})
     references = field_meta.get("references", [])
@@ -114,19 +168,20 @@ def _find_field_location(
 
     # Find the chunk matching the first reference
     ref_id = references[0]
-    for chunk in chunks:
-        # LandingAI returns Pydantic Chunk objects, access id attribute directly
-        chunk_id = chunk.id if hasattr(chunk, 'id') else None
-        if chunk_id == ref_id:
-            grounding = chunk.grounding if hasattr(chunk, 'grounding') else None
-            return _parse_grounding(grounding, chunk_id)
+    chunk = chunks_by_id.get(ref_id)
+    if chunk is None:
+        return None
 
-    return None
+    grounding = getattr(chunk, "grounding", None)
+    return _parse_grounding(grounding, ref_id)
 
 
 async def extract_document(file_path: Path) -> ExtractionResult:
     """Extract structured data from a PDF document using LandingAI ADE.
 
+    At most LANDINGAI_CONCURRENCY (default 4) documents are sent to
+    LandingAI at a time; callers may gather many extractions concurrently.
+
     Args:
         file_path: Path to the PDF file
 
@@ -138,34 +193,29 @@ async def extract_document(file_path: Path) -> ExtractionResult:
     try:
         client = get_client()
 
-        # Step 1: Parse the PDF
-        logger.info(f"Parsing document: {file_path}")
-        parse_response = client.parse(
-            document=file_path,
-            model="dpt-2-latest",
-        )
-
-        # Step 2: Extract structured data using schema
-        from landingai_ade.lib import pydantic_to_json_schema
-
-        schema = pydantic_to_json_schema(CommissioningReportSchema)
+        # The SDK calls are blocking network I/O; run them in worker threads so
+        # concurrent extractions overlap instead of stalling the event loop
+        async with _extract_semaphore():
+            # Step 1: Parse the PDF
+            logger.info("Parsing document: %s", file_path)
+            parse_response = await asyncio.to_thread(
+                client.parse,
+                document=file_path,
+                model=_PARSE_MODEL,
+            )
 
-        extract_response = client.extract(
-            schema=schema,
-            markdown=parse_response.markdown,
-            model="extract-latest",
-        )
+            # Step 2: Extract structured data using schema
+            extract_response = await asyncio.to_thread(
+                client.extract,
+                markdown=parse_response.markdown,
+                **_EXTRACT_KWARGS,
+            )
 
         # Step 3: Build extraction result with locations
-        chunks = parse_response.chunks if hasattr(parse_response, "chunks") else []
-        extraction_data = (
-            extract_response.extraction if hasattr(extract_response, "extraction") else {}
-        )
-        extraction_meta = (
-            extract_response.extraction_metadata
-            if hasattr(extract_response, "extraction_metadata")
-            else {}
-        )
+        chunks = getattr(parse_response, "chunks", [])
+        extraction_data = getattr(extract_response, "extraction", {})
+        extraction_meta = getattr(extract_response, "extraction_metadata", {})
+        chunks_by_id = _index_chunks(chunks)
 
         # Map extracted fields with their locations
         def make_field(name: str, value: Any) -> ExtractedField | None:
@@ -174,7 +224,7 @@ async def extract_document(file_path: Path) -> ExtractionResult:
             return ExtractedField(
                 name=name,
                 value=str(value),
-                location=_find_field_location(name, extraction_meta, chunks),
+                location=_find_field_location(name, extraction_meta, chunks_by_id),
             )
 
         # Build calibration info
@@ -201,17 +251,17 @@ async def extract_document(file_path: Path) -> ExtractionResult:
             ),
             calibrations=[calibration] if calibration.serial_number else [],
             measurements=[],  # TODO: Extract measurements in Phase 4/5
-            raw_markdown=parse_response.markdown if hasattr(parse_response, "markdown") else None,
+            raw_markdown=getattr(parse_response, "markdown", None),
             raw_chunks_count=len(chunks),
             processing_time_ms=processing_time,
-            model_version="dpt-2-latest",
+            model_version=_PARSE_MODEL,
         )
 
     except ValueError as e:
         # Missing API key
         raise
     except Exception as e:
-        logger.exception(f"Extraction failed for {file_path}")
+        logger.exception("Extraction failed for %s", file_path)
         return ExtractionResult(
             document_id=str(file_path),
             status="failed",
@@ -2,34 +2,94 @@
 
 Provides functions for saving uploaded files with unique names,
 calculating file hashes, and retrieving file paths.
+
+The upload directory is created once per process, by init_storage() at
+application startup (or lazily before the first write); it is not re-checked
+on every upload.
 """
 
+import asyncio
 import hashlib
+import io
+import os
+import shutil
+from functools import cache
 from pathlib import Path
+from typing import BinaryIO, cast
 from uuid import uuid4
 
-import aiofiles
 from fastapi import HTTPException, UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from src.storage.models import Document
 
-# Upload directory - created on first save
+# Upload directory - created once by init_storage()
 UPLOAD_DIR = Path("data/uploads")
 
+# Uploads are copied to disk in chunks of this size (1 MiB)
+CHUNK_SIZE = 1 << 20
 
-async def save_upload(file: UploadFile) -> tuple[str, str, int]:
-    """Save uploaded file to disk and return metadata.
+# SHA256 constructor, resolved once at import. file_digest() would otherwise
+# look the algorithm up by name on every upload. hashlib prefers OpenSSL,
+# whose SHA256 uses the CPU's SHA extensions when available.
+_SHA256 = hashlib.sha256
+HASH_BACKEND = "OpenSSL" if _SHA256.__module__ == "_hashlib" else "builtin"
 
-    Args:
-        file: FastAPI UploadFile object from multipart form
+
+@cache
+def _ensure_upload_dir() -> None:
+    """Create UPLOAD_DIR; runs at most once per process."""
+    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def init_storage() -> None:
+    """Prepare upload storage. Called from the application startup."""
+    _ensure_upload_dir()
+
+
+def _hash_stream(source: BinaryIO) -> tuple[str, int]:
+    """Hash source from the start, then rewind it for writing.
+
+    Blocking; runs in a worker thread.
 
     Returns:
-        Tuple of (file_path, file_hash, file_size):
-        - file_path: Absolute path to saved file
-        - file_hash: SHA256 hash of file content
-        - file_size: File size in bytes
+        Tuple of (SHA256 hex digest, size in bytes).
+    """
+    source.seek(0)
+    # Uploads are SpooledTemporaryFile or BytesIO, both buffered binary files
+    # with the readinto() that file_digest needs (BinaryIO does not declare it)
+    file_hash = hashlib.file_digest(cast(io.BufferedIOBase, source), _SHA256).hexdigest()
+    # file_digest reads BytesIO via getbuffer() without moving the position,
+    # so measure the size by seeking to the end
+    file_size = source.seek(0, os.SEEK_END)
+    source.seek(0)
+    return file_hash, file_size
 
-    Raises:
-        HTTPException 400: If file is not a PDF or is empty
+
+def _write_stream(source: BinaryIO, file_path: Path) -> None:
+    """Copy source to file_path in CHUNK_SIZE blocks.
+
+    Blocking; runs in a worker thread so the whole copy costs one thread hop.
     """
+    _ensure_upload_dir()
+    with open(file_path, "wb") as f:
+        shutil.copyfileobj(source, f, CHUNK_SIZE)
+
+
+async def _find_stored_copy(session: AsyncSession, file_hash: str) -> str | None:
+    """Return the path of an already stored upload with this hash, if still on disk."""
+    result = await session.execute(
+        select(Document.file_path).where(Document.file_hash == file_hash).distinct()
+    )
+    for existing_path in result.scalars():
+        if Path(existing_path).is_file():
+            return existing_path
+    return None
+
+
+def _check_filename(file: UploadFile) -> None:
+    """Reject uploads without a .pdf filename (HTTPException 400)."""
     # Validate file extension (case-insensitive)
     if not file.filename:
         raise HTTPException(status_code=400, detail="Filename is required")
@@ -39,29 +99,107 @@ async def save_upload(file: UploadFile) -> tuple[str, str, int]:
             status_code=400, detail="Only PDF files are accepted. Please upload a .pdf file."
         )
 
-    # Read file content
-    content = await file.read()
 
-    # Validate file is not empty
-    if len(content) == 0:
+def _check_size(file_size: int) -> None:
+    """Reject empty uploads (HTTPException 400)."""
+    if file_size == 0:
         raise HTTPException(status_code=400, detail="Uploaded file is empty")
 
-    # Calculate SHA256 hash for integrity/deduplication
-    file_hash = hashlib.sha256(content).hexdigest()
+
+async def _store_hashed(
+    file: UploadFile,
+    file_hash: str,
+    file_size: int,
+    session: AsyncSession | None,
+) -> tuple[str, str, int]:
+    """Write an already hashed and validated upload to disk, or reuse a stored duplicate."""
+    # Identical content already stored - skip the write
+    if session is not None:
+        existing_path = await _find_stored_copy(session, file_hash)
+        if existing_path is not None:
+            return existing_path, file_hash, file_size
 
     # Generate unique filename: {uuid}_{original_filename}
     unique_filename = f"{uuid4()}_{file.filename}"
     file_path = UPLOAD_DIR / unique_filename
 
-    # Create upload directory if it doesn't exist
-    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-
-    # Write file asynchronously
-    async with aiofiles.open(file_path, "wb") as f:
-        await f.write(content)
+    # Write to disk
+    await asyncio.to_thread(_write_stream, file.file, file_path)
 
     # Return absolute path, hash, and size
-    return str(file_path.absolute()), file_hash, len(content)
+    return str(file_path.absolute()), file_hash, file_size
+
+
+async def save_upload(
+    file: UploadFile,
+    session: AsyncSession | None = None,
+) -> tuple[str, str, int]:
+    """Save uploaded file to disk and return metadata.
+
+    The upload is hashed before anything is written. When a session is given
+    and a document with the same SHA256 is already stored, its file is reused
+    and nothing is written.
+
+    Args:
+        file: FastAPI UploadFile object from multipart form
+        session: Database session used to look up stored duplicates
+
+    Returns:
+        Tuple of (file_path, file_hash, file_size):
+        - file_path: Absolute path to saved (or reused) file
+        - file_hash: SHA256 hash of file content
+        - file_size: File size in bytes
+
+    Raises:
+        HTTPException 400: If file is not a PDF or is empty
+    """
+    _check_filename(file)
+
+    # Calculate SHA256 hash for integrity/deduplication, off the event loop.
+    # The spooled upload is read in blocks, so memory use does not grow with
+    # file size.
+    file_hash, file_size = await asyncio.to_thread(_hash_stream, file.file)
+    _check_size(file_size)
+
+    return await _store_hashed(file, file_hash, file_size, session)
+
+
+async def save_uploads(
+    files: list[UploadFile],
+    session: AsyncSession | None = None,
+) -> list[tuple[str, str, int]]:
+    """Save several uploaded files, hashing them in parallel.
+
+    hashlib releases the GIL while digesting, so the uploads are hashed
+    concurrently in worker threads. Every file is validated before the
+    first one is stored, so the batch is all-or-nothing: a rejected file
+    means nothing is written. Duplicate lookups and writes then run one
+    file at a time, since an AsyncSession must not be used concurrently.
+
+    Args:
+        files: FastAPI UploadFile objects from a multipart form
+        session: Database session used to look up stored duplicates
+
+    Returns:
+        One (file_path, file_hash, file_size) tuple per file, in order.
+
+    Raises:
+        HTTPException 400: If any file is not a PDF or is empty; nothing is
+            written in that case
+    """
+    for file in files:
+        _check_filename(file)
+
+    digests = await asyncio.gather(
+        *(asyncio.to_thread(_hash_stream, file.file) for file in files)
+    )
+    for _, file_size in digests:
+        _check_size(file_size)
+
+    return [
+        await _store_hashed(file, file_hash, file_size, session)
+        for file, (file_hash, file_size) in zip(files, digests, strict=True)
+    ]
 
 
 def get_upload_path(filename: str) -> Path:
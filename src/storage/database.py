@@ -6,9 +6,16 @@ SQLModel provides the ORM layer on top of SQLAlchemy.
 
 import os
 from collections.abc import AsyncGenerator
-
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from functools import cache
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import ORMExecuteState, Session
 from sqlmodel import SQLModel
 
 # Database URL from environment (PostgreSQL for production, SQLite for dev)
@@ -17,48 +24,152 @@ DATABASE_URL = os.environ.get(
     "sqlite+aiosqlite:///./data/auditeng.db"
 )
 
-# Railway uses postgres:// but SQLAlchemy needs postgresql://
-if DATABASE_URL.startswith("postgres://"):
-    DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql+asyncpg://", 1)
-elif DATABASE_URL.startswith("postgresql://"):
-    DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
 
-# Create async engine with appropriate settings
-engine_kwargs = {
-    "echo": False,
-    "future": True,
-}
+def _normalize_url(url: str) -> str:
+    """Point PostgreSQL URLs at the asyncpg driver.
+
+    Railway uses postgres:// but SQLAlchemy needs postgresql+asyncpg://.
+    """
+    for prefix in ("postgres://", "postgresql://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+DATABASE_URL = _normalize_url(DATABASE_URL)
+
+# SQLite tuning applied to every new connection:
+# - WAL lets readers run alongside a writer and avoids a journal fsync per commit
+# - synchronous=NORMAL is durable under WAL except on power loss
+# - temp tables, mmap and page cache sized for the auth/document workload
+# - foreign_keys enforces FOREIGN KEY constraints, including ON DELETE CASCADE
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA foreign_keys=ON",
+)
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Connection event hook that applies SQLITE_PRAGMAS."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
 
-# SQLite needs special handling for async
-if "sqlite" in DATABASE_URL:
-    engine_kwargs["connect_args"] = {"check_same_thread": False}
 
-engine = create_async_engine(DATABASE_URL, **engine_kwargs)
+def _build_sqlite_engine(url: str) -> AsyncEngine:
+    """SQLite engine with SQLITE_PRAGMAS applied to each connection."""
+    sqlite_engine = create_async_engine(
+        url,
+        echo=False,
+        future=True,
+        connect_args={"check_same_thread": False},
+    )
+    event.listen(sqlite_engine.sync_engine, "connect", set_sqlite_pragmas)
+    return sqlite_engine
+
+
+def _build_postgres_engine(url: str) -> AsyncEngine:
+    """PostgreSQL engine with a pool sized for concurrent API load.
+
+    SQLAlchemy defaults to 5 + 10 overflow; pre-ping and recycle drop
+    connections the platform proxy closed.
+    """
+    return create_async_engine(
+        url,
+        echo=False,
+        future=True,
+        pool_size=int(os.environ.get("DB_POOL_SIZE", "25")),
+        max_overflow=int(os.environ.get("DB_MAX_OVERFLOW", "25")),
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        pool_timeout=10,
+    )
+
+
+@cache
+def _build_engine(url: str) -> AsyncEngine:
+    """Build the engine for url once per process, specialized by backend."""
+    if url.startswith("sqlite"):
+        return _build_sqlite_engine(url)
+    if url.startswith("postgresql+asyncpg://"):
+        return _build_postgres_engine(url)
+    return create_async_engine(url, echo=False, future=True)
+
+
+class AppSession(Session):
+    """Sync session class behind the app's AsyncSessions.
+
+    A subclass of its own so the write-tracking listeners below apply only
+    to sessions built by this module's factories, not every Session in the
+    process.
+    """
+
+
+engine = _build_engine(DATABASE_URL)
 
 # Async session factory
-async_session = sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
+async_session = async_sessionmaker(
+    engine, expire_on_commit=False, sync_session_class=AppSession
 )
 
 
+# Session.info key set while a transaction holds uncommitted writes
+_WRITES_PENDING = "writes_pending"
+
+
+@event.listens_for(AppSession, "after_flush")
+def _mark_writes_pending(session: Session, flush_context) -> None:
+    session.info[_WRITES_PENDING] = True
+
+
+@event.listens_for(AppSession, "do_orm_execute")
+def _mark_statement_writes_pending(orm_execute_state: ORMExecuteState) -> None:
+    # Core DML (update(), delete(), insert(), text()) bypasses the flush;
+    # treat anything but a SELECT as a write
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[_WRITES_PENDING] = True
+
+
+@event.listens_for(AppSession, "after_commit")
+@event.listens_for(AppSession, "after_rollback")
+def _clear_writes_pending(session: Session) -> None:
+    session.info.pop(_WRITES_PENDING, None)
+
+
+def _has_pending_writes(session: AsyncSession) -> bool:
+    """True if the session has unflushed changes or executed, uncommitted writes."""
+    return bool(
+        session.new or session.dirty or session.deleted or session.info.get(_WRITES_PENDING)
+    )
+
+
 async def init_db() -> None:
     """Initialize database and create all tables.
 
     Called on application startup. Safe to call multiple times -
-    SQLModel only creates tables that don't exist.
+    SQLModel only creates tables that don't exist, and upgrade_schema only
+    alters tables that predate the current models.
     """
     # Import models to ensure they're registered with SQLModel.metadata
     from src.storage import models  # noqa: F401
+    from src.storage.schema_upgrade import upgrade_schema
 
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.run_sync(upgrade_schema)
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting async database sessions.
 
+    Commits on exit only if the request left writes behind; read-only
+    requests skip the COMMIT round trip and the connection is simply reset.
+
     Usage in FastAPI:
         @app.get("/items")
         async def get_items(session: AsyncSession = Depends(get_session)):
@@ -67,7 +178,8 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
         try:
             yield session
-            await session.commit()
+            if _has_pending_writes(session):
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
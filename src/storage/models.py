@@ -6,9 +6,9 @@ All models use table=True to create database tables.
 
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -29,6 +29,22 @@ class User(SQLModel, table=True):
     """
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Login reads only these columns; on PostgreSQL the lookup by email
+        # is then an index-only scan. Created on PostgreSQL only: SQLite
+        # ignores INCLUDE, leaving a duplicate of the unique email index.
+        Index(
+            "ix_users_email_covering",
+            "email",
+            postgresql_include=[
+                "hashed_password",
+                "is_active",
+                "is_superuser",
+                "locked_until",
+                "failed_login_attempts",
+            ],
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     email: str = Field(unique=True, index=True, max_length=255)
@@ -45,8 +61,11 @@ class User(SQLModel, table=True):
 
     # Relationships
     documents: list["Document"] = Relationship(back_populates="user")
-    sessions: list["Session"] = Relationship(back_populates="user")
-    password_reset_tokens: list["PasswordResetToken"] = Relationship(back_populates="user")
+    # Sessions and reset tokens are removed by the database (ON DELETE CASCADE)
+    sessions: list["Session"] = Relationship(back_populates="user", passive_deletes=True)
+    password_reset_tokens: list["PasswordResetToken"] = Relationship(
+        back_populates="user", passive_deletes=True
+    )
 
 
 class Document(SQLModel, table=True):
@@ -114,9 +133,14 @@ class Session(SQLModel, table=True):
     """
 
     __tablename__ = "sessions"
+    __table_args__ = (
+        # Active-session queries filter on user_id and is_revoked together;
+        # also serves plain user_id lookups
+        Index("ix_sessions_user_active", "user_id", "is_revoked"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    user_id: UUID = Field(foreign_key="users.id", index=True)
+    user_id: UUID = Field(foreign_key="users.id", ondelete="CASCADE")
     token_hash: str = Field(max_length=64, index=True)  # SHA256 hash of JWT
     device_info: str | None = Field(default=None, max_length=500)
     ip_address: str | None = Field(default=None, max_length=45)  # IPv6 max length
@@ -138,7 +162,7 @@ class PasswordResetToken(SQLModel, table=True):
     __tablename__ = "password_reset_tokens"
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    user_id: UUID = Field(foreign_key="users.id", index=True)
+    user_id: UUID = Field(foreign_key="users.id", index=True, ondelete="CASCADE")
     token_hash: str = Field(max_length=64, index=True)  # SHA256 hash of reset token
     created_at: datetime = Field(default_factory=datetime.utcnow)
     expires_at: datetime
@@ -0,0 +1,101 @@
+"""In-place upgrades for databases created by earlier releases.
+
+SQLModel.metadata.create_all only creates missing tables; it never alters
+existing ones. Schema changes to existing tables are applied here instead,
+from init_db on every startup. Each step inspects the live schema first and
+does nothing when the database is already up to date.
+"""
+
+from sqlalchemy import Connection, Table, inspect, text
+from sqlalchemy.schema import AddConstraint
+from sqlmodel import SQLModel
+
+from src.storage import models  # noqa: F401  (registers the tables)
+
+# Tables whose user_id foreign key must be ON DELETE CASCADE
+_USER_CASCADE_TABLES = ("sessions", "password_reset_tokens")
+
+# Indexes the models no longer declare: sessions.user_id lookups are served
+# by the leading column of ix_sessions_user_active
+_RETIRED_INDEXES = ("ix_sessions_user_id",)
+
+
+def upgrade_schema(conn: Connection) -> None:
+    """Apply all pending upgrades on conn (run inside init_db's transaction)."""
+    for table_name in _USER_CASCADE_TABLES:
+        _cascade_user_deletes(conn, SQLModel.metadata.tables[table_name])
+    _sync_indexes(conn)
+
+
+def _sync_indexes(conn: Connection) -> None:
+    """Create model indexes missing from existing tables; drop retired ones.
+
+    Index.create honours ddl_if, so dialect-specific indexes such as
+    ix_users_email_covering are only created where they apply.
+    """
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+    for index_name in _RETIRED_INDEXES:
+        conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+
+
+def _cascade_user_deletes(conn: Connection, table: Table) -> None:
+    """Make table's user_id foreign key ON DELETE CASCADE.
+
+    User.sessions and User.password_reset_tokens use passive_deletes, so
+    deleting a user relies on the database to remove these rows.
+    """
+    foreign_keys = inspect(conn).get_foreign_keys(table.name)
+    stale = [
+        fk
+        for fk in foreign_keys
+        if fk["referred_table"] == "users"
+        and (fk.get("options") or {}).get("ondelete", "").upper() != "CASCADE"
+    ]
+    if not stale:
+        return
+
+    if conn.dialect.name == "sqlite":
+        # SQLite cannot alter a constraint; rebuild the table instead
+        _rebuild_sqlite_table(conn, table)
+        return
+
+    for fk in stale:
+        conn.execute(text(f'ALTER TABLE {table.name} DROP CONSTRAINT "{fk["name"]}"'))
+    for constraint in table.foreign_key_constraints:
+        if constraint.referred_table.name == "users":
+            conn.execute(AddConstraint(constraint))
+
+
+def _rebuild_sqlite_table(conn: Connection, table: Table) -> None:
+    """Recreate table from the current model, keeping its rows.
+
+    Rows whose user no longer exists are dropped: they could only exist
+    because foreign keys were not enforced, and the cascade would have
+    removed them.
+    """
+    old_name = f"_{table.name}_old"
+    existing = {column["name"] for column in inspect(conn).get_columns(table.name)}
+    columns = ", ".join(column.name for column in table.columns if column.name in existing)
+
+    conn.execute(text(f"ALTER TABLE {table.name} RENAME TO {old_name}"))
+    # Indexes keep their names across the rename; free them for the new table
+    old_indexes = conn.execute(
+        text(
+            "SELECT name FROM sqlite_master WHERE type = 'index' "
+            "AND tbl_name = :table AND sql IS NOT NULL"
+        ),
+        {"table": old_name},
+    ).scalars()
+    for index_name in list(old_indexes):
+        conn.execute(text(f'DROP INDEX "{index_name}"'))
+
+    table.create(conn)
+    conn.execute(
+        text(
+            f"INSERT INTO {table.name} ({columns}) SELECT {columns} FROM {old_name} "
+            "WHERE user_id IN (SELECT id FROM users)"
+        )
+    )
+    conn.execute(text(f"DROP TABLE {old_name}"))
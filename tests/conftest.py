@@ -1,21 +1,106 @@
 """Pytest configuration and fixtures."""
 
 import os
+from functools import cache
+from pathlib import Path
+
 import pytest
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from pwdlib import PasswordHash
+from pwdlib.hashers.bcrypt import BcryptHasher
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel
 
 from src.api.main import app
+from src.domain.services import auth
+from src.domain.services.auth import hash_password
+from src.pipeline import file_storage
 from src.storage import database
 
-# Use a test-specific database
-TEST_DATABASE_URL = "sqlite+aiosqlite:///./data/test_auditeng.db"
+# Use a test-specific in-memory database. StaticPool keeps the single
+# connection (and so the database) alive and shared by every session.
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+# Test data is disposable: skip fsync and keep journals in memory.
+# Foreign keys are enforced as in production.
+TEST_SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=OFF",
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA foreign_keys=ON",
+)
 
 # Create test engine and session factory
-test_engine = create_async_engine(TEST_DATABASE_URL, echo=False, future=True)
-test_async_session = sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+test_engine = create_async_engine(
+    TEST_DATABASE_URL,
+    echo=False,
+    future=True,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+test_async_session = async_sessionmaker(
+    test_engine, expire_on_commit=False, sync_session_class=database.AppSession
+)
+
+
+@event.listens_for(test_engine.sync_engine, "connect")
+def _set_test_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    for pragma in TEST_SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+    # Let SQLAlchemy emit BEGIN itself (below) so SAVEPOINTs nest properly;
+    # the sqlite3 driver's implicit transactions do not support them
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(test_engine.sync_engine, "begin")
+def _begin_sqlite_transaction(conn) -> None:
+    conn.exec_driver_sql("BEGIN")
+
+
+@cache
+def cached_password_hash(password: str) -> str:
+    """bcrypt hash of password, computed once per test session.
+
+    Fixtures create users with a handful of fixed passwords; any valid hash
+    of the password verifies, so re-hashing it for every test only burns CPU.
+    """
+    return hash_password(password)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """Use the minimum bcrypt cost (4 rounds) for the whole test session.
+
+    Hashing and verification still run the real bcrypt code, just cheaply;
+    production keeps the default cost. Patched directly rather than via
+    BCRYPT_ROUNDS, since auth is imported before any fixture runs.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(auth, "pwd_context", PasswordHash((BcryptHasher(rounds=4),)))
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_upload_dir():
+    """Give each pytest-xdist worker its own upload directory.
+
+    The in-memory database is already private to each worker process; the
+    upload directory is the only state shared on disk, and upload tests
+    clear it after themselves.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker is None:
+        yield
+        return
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(file_storage, "UPLOAD_DIR", Path("data/uploads") / worker)
+        file_storage._ensure_upload_dir.cache_clear()
+        yield
+    file_storage._ensure_upload_dir.cache_clear()
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -42,9 +127,13 @@ async def setup_test_database():
     # The file will be cleaned up on next test run when tables are recreated
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def client():
-    """Async test client for FastAPI app."""
+    """Async test client for FastAPI app, shared by the whole session.
+
+    The app sets no cookies and per-test state lives in the database, which
+    db_session rolls back, so one client and transport serve every test.
+    """
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test"
@@ -53,7 +142,28 @@ async def client():
 
 
 @pytest.fixture
-async def db_session():
-    """Async database session for tests."""
-    async with test_async_session() as session:
-        yield session
+async def db_session(setup_test_database):
+    """Async database session for tests, rolled back afterwards.
+
+    The schema is created once per session by setup_test_database; each
+    test only opens a transaction. The test runs inside that one outer
+    transaction. Both this session and the app's sessions (via
+    database.async_session) join it with SAVEPOINTs, so their commits are
+    visible to each other but nothing outlives the test.
+    """
+    async with test_engine.connect() as conn:
+        outer = await conn.begin()
+        session_factory = async_sessionmaker(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+            sync_session_class=database.AppSession,
+        )
+        app_session_factory = database.async_session
+        database.async_session = session_factory
+        try:
+            async with session_factory() as session:
+                yield session
+        finally:
+            database.async_session = app_session_factory
+            await outer.rollback()
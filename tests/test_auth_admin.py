@@ -1,15 +1,19 @@
 """Tests for admin user management endpoints."""
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime
 from uuid import uuid4
 
 from httpx import AsyncClient
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.domain.services.auth import hash_password
 from src.storage.models import User, Session
+from tests.conftest import cached_password_hash
+
+
+# Fixed far-future lock expiry (naive UTC, like the column)
+LOCKED_UNTIL = datetime(2099, 1, 1)
 
 
 @pytest.fixture
@@ -27,12 +31,11 @@ async def admin_user(db_session: AsyncSession):
         await db_session.execute(
             delete(User).where(User.email == "admin@example.com")
         )
-        await db_session.commit()
 
     user = User(
         id=uuid4(),
         email="admin@example.com",
-        hashed_password=hash_password("adminpass123"),
+        hashed_password=cached_password_hash("adminpass123"),
         is_active=True,
         is_superuser=True,  # Admin!
         failed_login_attempts=0,
@@ -59,12 +62,11 @@ async def regular_user(db_session: AsyncSession):
         await db_session.execute(
             delete(User).where(User.email == "user@example.com")
         )
-        await db_session.commit()
 
     user = User(
         id=uuid4(),
         email="user@example.com",
-        hashed_password=hash_password("userpass123"),
+        hashed_password=cached_password_hash("userpass123"),
         is_active=True,
         is_superuser=False,  # Not admin
         failed_login_attempts=0,
@@ -91,16 +93,15 @@ async def locked_user(db_session: AsyncSession):
         await db_session.execute(
             delete(User).where(User.email == "locked@example.com")
         )
-        await db_session.commit()
 
     user = User(
         id=uuid4(),
         email="locked@example.com",
-        hashed_password=hash_password("lockedpass123"),
+        hashed_password=cached_password_hash("lockedpass123"),
         is_active=True,
         is_superuser=False,
         failed_login_attempts=3,
-        locked_until=datetime.utcnow() + timedelta(hours=1),
+        locked_until=LOCKED_UNTIL,
         must_change_password=False,
     )
     db_session.add(user)
@@ -1,15 +1,16 @@
 """Integration tests for authentication with existing endpoints."""
 
-import io
 from uuid import uuid4
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import delete, select
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.domain.services.auth import hash_password, create_access_token, hash_token
+from src.domain.services.auth import create_access_token_with_hash
 from src.storage.models import Document, User, Session
+from tests.conftest import cached_password_hash
+from tests.conftest import test_async_session as committing_session
 
 
 # Minimal valid PDF bytes (PDF 1.4 format)
@@ -29,13 +30,13 @@ startxref
 %%EOF"""
 
 
-async def cleanup_user(db_session: AsyncSession, email: str):
-    """Clean up user and related sessions."""
-    await db_session.execute(delete(Session).where(Session.user_id.in_(
-        select(User.id).where(User.email == email)
-    )))
-    await db_session.execute(delete(User).where(User.email == email))
-    await db_session.commit()
+def _pdf(name: str = "test.pdf") -> dict:
+    """Multipart files payload for MINIMAL_PDF.
+
+    httpx accepts the bytes directly, so no BytesIO wrapper (or copy) is
+    needed and the payload can be reused.
+    """
+    return {"file": (name, MINIMAL_PDF, "application/pdf")}
 
 
 async def create_user_with_token(
@@ -45,24 +46,23 @@ async def create_user_with_token(
     is_superuser: bool = False,
     must_change_password: bool = False,
 ) -> tuple[User, str]:
-    """Create a user and return with auth token."""
-    await cleanup_user(db_session, email)
+    """Create a user and return with auth token.
 
+    The user and its session are inserted with a single commit; every
+    column is set client-side, so no refresh is needed.
+    """
     user = User(
         id=uuid4(),
         email=email,
-        hashed_password=hash_password(password),
+        hashed_password=cached_password_hash(password),
         is_active=True,
         is_superuser=is_superuser,
         failed_login_attempts=0,
         must_change_password=must_change_password,
     )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
 
     # Create token and session
-    token, expires_at = create_access_token(
+    token, token_hash, expires_at = create_access_token_with_hash(
         user_id=user.id,
         email=user.email,
         is_admin=user.is_superuser,
@@ -70,25 +70,50 @@ async def create_user_with_token(
     )
     session = Session(
         user_id=user.id,
-        token_hash=hash_token(token),
+        token_hash=token_hash,
         expires_at=expires_at,
         is_revoked=False,
     )
-    db_session.add(session)
+    db_session.add_all([user, session])
     await db_session.commit()
 
     return user, token
 
 
+@pytest.fixture(scope="module")
+async def shared_doc(client: AsyncClient):
+    """One uploaded document for tests that only need an existing doc id.
+
+    Committed outside the per-test rollback so the module uploads it once;
+    deleted again at module teardown. Returns (doc_id, owner, owner_token).
+    """
+    async with committing_session() as session:
+        owner, token = await create_user_with_token(session, "shareddoc_owner@example.com")
+
+    response = await client.post(
+        "/documents/upload",
+        files=_pdf("shared.pdf"),
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 201
+
+    yield response.json()["id"], owner, token
+
+    async with committing_session() as session:
+        await session.execute(delete(Document).where(Document.user_id == owner.id))
+        # The owner's session goes with the user (ON DELETE CASCADE)
+        await session.execute(delete(User).where(User.id == owner.id))
+        await session.commit()
+
+
 class TestDocumentAuthIntegration:
     """Tests for document endpoints with auth."""
 
+    # NOTE: do not add a user fixture - negative path only, no user needed
     @pytest.mark.asyncio
     async def test_upload_requires_auth(self, client: AsyncClient):
         """Document upload without auth returns 401."""
-        files = {"file": ("test.pdf", io.BytesIO(MINIMAL_PDF), "application/pdf")}
-
-        response = await client.post("/documents/upload", files=files)
+        response = await client.post("/documents/upload", files=_pdf("test.pdf"))
 
         assert response.status_code == 401
         assert "Authentication required" in response.json()["detail"]
@@ -100,11 +125,9 @@ class TestDocumentAuthIntegration:
         """Document upload with auth succeeds."""
         user, token = await create_user_with_token(db_session, "upload_test@example.com")
 
-        files = {"file": ("test.pdf", io.BytesIO(MINIMAL_PDF), "application/pdf")}
-
         response = await client.post(
             "/documents/upload",
-            files=files,
+            files=_pdf("test.pdf"),
             headers={"Authorization": f"Bearer {token}"},
         )
 
@@ -112,18 +135,9 @@ class TestDocumentAuthIntegration:
         assert response.json()["filename"] == "test.pdf"
 
     @pytest.mark.asyncio
-    async def test_extract_requires_auth(self, client: AsyncClient, db_session: AsyncSession):
+    async def test_extract_requires_auth(self, client: AsyncClient, shared_doc):
         """Document extraction without auth returns 401."""
-        # Create a document with auth first
-        user, token = await create_user_with_token(db_session, "extract_auth_test@example.com")
-
-        files = {"file": ("test.pdf", io.BytesIO(MINIMAL_PDF), "application/pdf")}
-        upload_response = await client.post(
-            "/documents/upload",
-            files=files,
-            headers={"Authorization": f"Bearer {token}"},
-        )
-        doc_id = upload_response.json()["id"]
+        doc_id, _, _ = shared_doc
 
         # Try extraction without auth
         response = await client.post(f"/documents/{doc_id}/extract")
@@ -132,18 +146,11 @@ class TestDocumentAuthIntegration:
 
     @pytest.mark.asyncio
     async def test_cannot_access_other_users_document(
-        self, client: AsyncClient, db_session: AsyncSession
+        self, client: AsyncClient, db_session: AsyncSession, shared_doc
     ):
         """User cannot access another user's document."""
-        # User 1 uploads document
-        user1, token1 = await create_user_with_token(db_session, "user1@example.com")
-        files = {"file": ("user1.pdf", io.BytesIO(MINIMAL_PDF), "application/pdf")}
-        upload_response = await client.post(
-            "/documents/upload",
-            files=files,
-            headers={"Authorization": f"Bearer {token1}"},
-        )
-        doc_id = upload_response.json()["id"]
+        # Document belongs to the shared owner
+        doc_id, _, _ = shared_doc
 
         # User 2 tries to extract it
         user2, token2 = await create_user_with_token(db_session, "user2@example.com")
@@ -157,18 +164,11 @@ class TestDocumentAuthIntegration:
 
     @pytest.mark.asyncio
     async def test_admin_can_access_any_document(
-        self, client: AsyncClient, db_session: AsyncSession
+        self, client: AsyncClient, db_session: AsyncSession, shared_doc
     ):
         """Admin can access any user's document."""
-        # Regular user uploads document
-        user, token = await create_user_with_token(db_session, "regular@example.com")
-        files = {"file": ("regular.pdf", io.BytesIO(MINIMAL_PDF), "application/pdf")}
-        upload_response = await client.post(
-            "/documents/upload",
-            files=files,
-            headers={"Authorization": f"Bearer {token}"},
-        )
-        doc_id = upload_response.json()["id"]
+        # Document belongs to a regular user
+        doc_id, _, _ = shared_doc
 
         # Admin can access (extraction may fail due to external API, but auth should pass)
         admin, admin_token = await create_user_with_token(
@@ -196,11 +196,9 @@ class TestMustChangePasswordBlocking:
             db_session, "mustchange@example.com", must_change_password=True
         )
 
-        files = {"file": ("blocked.pdf", io.BytesIO(MINIMAL_PDF), "application/pdf")}
-
         response = await client.post(
             "/documents/upload",
-            files=files,
+            files=_pdf("blocked.pdf"),
             headers={"Authorization": f"Bearer {token}"},
         )
 
@@ -258,11 +256,9 @@ class TestMustChangePasswordBlocking:
         token2 = login_response.json()["access_token"]
 
         # Now upload should work
-        files = {"file": ("unblocked.pdf", io.BytesIO(MINIMAL_PDF), "application/pdf")}
-
         response = await client.post(
             "/documents/upload",
-            files=files,
+            files=_pdf("unblocked.pdf"),
             headers={"Authorization": f"Bearer {token2}"},
         )
 
@@ -286,24 +282,21 @@ class TestSessionValidation:
         )
 
         # Try to use revoked token
-        files = {"file": ("revoked.pdf", io.BytesIO(MINIMAL_PDF), "application/pdf")}
-
         response = await client.post(
             "/documents/upload",
-            files=files,
+            files=_pdf("revoked.pdf"),
             headers={"Authorization": f"Bearer {token}"},
         )
 
         assert response.status_code == 401
 
+    # NOTE: do not add a user fixture - negative path only, no user needed
     @pytest.mark.asyncio
     async def test_invalid_token_rejected(self, client: AsyncClient):
         """Invalid JWT token is rejected."""
-        files = {"file": ("test.pdf", io.BytesIO(MINIMAL_PDF), "application/pdf")}
-
         response = await client.post(
             "/documents/upload",
-            files=files,
+            files=_pdf("test.pdf"),
             headers={"Authorization": "Bearer invalid_token_here"},
         )
 
@@ -314,18 +307,9 @@ class TestValidationAuthIntegration:
     """Tests for validation endpoint with auth."""
 
     @pytest.mark.asyncio
-    async def test_validate_requires_auth(self, client: AsyncClient, db_session: AsyncSession):
+    async def test_validate_requires_auth(self, client: AsyncClient, shared_doc):
         """Validation without auth returns 401."""
-        # Create a document first
-        user, token = await create_user_with_token(db_session, "validate_auth@example.com")
-
-        files = {"file": ("test.pdf", io.BytesIO(MINIMAL_PDF), "application/pdf")}
-        upload_response = await client.post(
-            "/documents/upload",
-            files=files,
-            headers={"Authorization": f"Bearer {token}"},
-        )
-        doc_id = upload_response.json()["id"]
+        doc_id, _, _ = shared_doc
 
         # Try to validate without auth
         response = await client.post(f"/documents/{doc_id}/validate")
@@ -334,18 +318,11 @@ class TestValidationAuthIntegration:
 
     @pytest.mark.asyncio
     async def test_validate_other_user_document_denied(
-        self, client: AsyncClient, db_session: AsyncSession
+        self, client: AsyncClient, db_session: AsyncSession, shared_doc
     ):
         """User cannot validate another user's document."""
-        # User 1 uploads
-        user1, token1 = await create_user_with_token(db_session, "validate_user1@example.com")
-        files = {"file": ("user1_validate.pdf", io.BytesIO(MINIMAL_PDF), "application/pdf")}
-        upload_response = await client.post(
-            "/documents/upload",
-            files=files,
-            headers={"Authorization": f"Bearer {token1}"},
-        )
-        doc_id = upload_response.json()["id"]
+        # Document belongs to the shared owner
+        doc_id, _, _ = shared_doc
 
         # User 2 tries to validate
         user2, token2 = await create_user_with_token(db_session, "validate_user2@example.com")
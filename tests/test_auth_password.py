@@ -1,28 +1,29 @@
 """Tests for password management endpoints."""
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.domain.services.auth import hash_password, generate_reset_token, hash_token
+from src.domain.services.auth import generate_reset_token, hash_token
 from src.storage.models import User, PasswordResetToken
+from tests.conftest import cached_password_hash
+
+
+def _utcnow() -> datetime:
+    """Current UTC time as a naive datetime, like the token columns."""
+    return datetime.now(UTC).replace(tzinfo=None)
 
 
 @pytest.fixture
 async def test_user(db_session: AsyncSession):
-    """Create a test user."""
-    # Use unique email with timestamp to avoid conflicts
-    from time import time
-    from sqlalchemy import delete
-    from src.storage.models import Session, PasswordResetToken
-
+    """Create a test user; db_session rolls it back after the test."""
     user = User(
         id=uuid4(),
-        email=f"test{int(time()*1000000)}@example.com",
-        hashed_password=hash_password("currentpass123"),
+        email=f"test-{uuid4().hex}@example.com",
+        hashed_password=cached_password_hash("currentpass123"),
         is_active=True,
         is_superuser=False,
         failed_login_attempts=0,
@@ -30,26 +31,16 @@ async def test_user(db_session: AsyncSession):
     )
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
-    yield user
-    # Cleanup after test - delete related records first
-    await db_session.execute(delete(Session).where(Session.user_id == user.id))
-    await db_session.execute(delete(PasswordResetToken).where(PasswordResetToken.user_id == user.id))
-    await db_session.delete(user)
-    await db_session.commit()
+    return user
 
 
 @pytest.fixture
 async def user_must_change(db_session: AsyncSession):
-    """Create a user who must change password."""
-    from time import time
-    from sqlalchemy import delete
-    from src.storage.models import Session, PasswordResetToken
-
+    """Create a user who must change password; rolled back after the test."""
     user = User(
         id=uuid4(),
-        email=f"mustchange{int(time()*1000000)}@example.com",
-        hashed_password=hash_password("temppass123"),
+        email=f"mustchange-{uuid4().hex}@example.com",
+        hashed_password=cached_password_hash("temppass123"),
         is_active=True,
         is_superuser=False,
         failed_login_attempts=0,
@@ -57,13 +48,7 @@ async def user_must_change(db_session: AsyncSession):
     )
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
-    yield user
-    # Cleanup after test - delete related records first
-    await db_session.execute(delete(Session).where(Session.user_id == user.id))
-    await db_session.execute(delete(PasswordResetToken).where(PasswordResetToken.user_id == user.id))
-    await db_session.delete(user)
-    await db_session.commit()
+    return user
 
 
 async def get_token(client: AsyncClient, email: str, password: str) -> str:
@@ -191,7 +176,7 @@ class TestResetPassword:
         token_record = PasswordResetToken(
             user_id=test_user.id,
             token_hash=hash_token(raw_token),
-            expires_at=datetime.utcnow() + timedelta(minutes=15),
+            expires_at=_utcnow() + timedelta(minutes=15),
         )
         db_session.add(token_record)
         await db_session.commit()
@@ -204,7 +189,7 @@ class TestResetPassword:
         token_record = PasswordResetToken(
             user_id=test_user.id,
             token_hash=hash_token(raw_token),
-            expires_at=datetime.utcnow() - timedelta(minutes=1),  # Already expired
+            expires_at=_utcnow() - timedelta(minutes=1),  # Already expired
         )
         db_session.add(token_record)
         await db_session.commit()
@@ -214,11 +199,12 @@ class TestResetPassword:
     async def used_token(self, test_user, db_session: AsyncSession):
         """Create an already-used reset token."""
         raw_token = generate_reset_token()
+        now = _utcnow()
         token_record = PasswordResetToken(
             user_id=test_user.id,
             token_hash=hash_token(raw_token),
-            expires_at=datetime.utcnow() + timedelta(minutes=15),
-            used_at=datetime.utcnow(),  # Already used
+            expires_at=now + timedelta(minutes=15),
+            used_at=now,  # Already used
         )
         db_session.add(token_record)
         await db_session.commit()
@@ -286,7 +272,7 @@ class TestResetPassword:
         """Password reset clears account lockout."""
         # First lock the account
         test_user.failed_login_attempts = 3
-        test_user.locked_until = datetime.utcnow() + timedelta(minutes=30)
+        test_user.locked_until = _utcnow() + timedelta(minutes=30)
         db_session.add(test_user)
         await db_session.commit()
 
@@ -0,0 +1,43 @@
+"""Tests for batch validation across many reports."""
+
+from datetime import date
+
+from src.domain.schemas.extraction import ExtractedField, GroundingData, MeggerData
+from src.domain.validators.batch import validate_groundings_batch, validate_meggers_batch
+from src.domain.validators.grounding_resistance import validate_grounding_resistance
+from src.domain.validators.megger import validate_megger_all
+
+
+class TestBatchValidation:
+    """Batch results match per-report validation, in input order."""
+
+    def test_groundings_batch_matches_single(self):
+        """Each grounding report gets the same findings as a direct call."""
+        groundings = [
+            GroundingData(resistance_value=ExtractedField(name="resistance", value=value))
+            for value in ("2.0", "7.5", "12.0", "abc")
+        ]
+
+        results = validate_groundings_batch(groundings, max_workers=2)
+
+        assert results == [validate_grounding_resistance(g) for g in groundings]
+
+    def test_meggers_batch_matches_single(self):
+        """Each megger report gets the same findings as validate_megger_all."""
+        test_date = date(2024, 1, 22)
+        meggers = [
+            MeggerData(
+                equipment_voltage_rating=ExtractedField(name="voltage_rating", value=rating),
+                test_voltage=ExtractedField(name="test_voltage", value="1000"),
+                insulation_resistance=ExtractedField(name="resistance", value="50"),
+            )
+            for rating in ("250", "480", "2000")
+        ]
+
+        results = validate_meggers_batch(meggers, test_date, max_workers=2)
+
+        assert results == [validate_megger_all(m, test_date) for m in meggers]
+
+    def test_empty_batch(self):
+        """Empty input returns an empty list without starting a pool."""
+        assert validate_groundings_batch([]) == []
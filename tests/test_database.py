@@ -0,0 +1,196 @@
+"""Tests for database session handling."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import MetaData, inspect, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+
+from src.storage.database import get_session
+from src.storage.models import PasswordResetToken, Session, User
+from src.storage.schema_upgrade import upgrade_schema
+
+
+async def _close(session_gen) -> None:
+    """Run the get_session dependency to completion."""
+    with pytest.raises(StopAsyncIteration):
+        await session_gen.__anext__()
+
+
+def _new_user() -> User:
+    return User(email=f"db-{uuid4().hex}@example.com", hashed_password="x")
+
+
+async def _user_exists(db_session: AsyncSession, email: str) -> bool:
+    result = await db_session.execute(select(User).where(User.email == email))
+    return result.scalar_one_or_none() is not None
+
+
+class TestGetSession:
+    """Test commit-on-exit behaviour of get_session."""
+
+    async def test_pending_changes_committed(self, db_session: AsyncSession):
+        """Objects added but not flushed are committed on exit."""
+        session_gen = get_session()
+        session = await session_gen.__anext__()
+        user = _new_user()
+        session.add(user)
+        await _close(session_gen)
+
+        assert await _user_exists(db_session, user.email)
+
+    async def test_flushed_changes_committed(self, db_session: AsyncSession):
+        """Writes already flushed (e.g. by autoflush) are still committed on exit."""
+        session_gen = get_session()
+        session = await session_gen.__anext__()
+        user = _new_user()
+        session.add(user)
+        await session.flush()
+        await _close(session_gen)
+
+        assert await _user_exists(db_session, user.email)
+
+    async def test_core_update_committed(self, db_session: AsyncSession):
+        """A bare update() never flushes but is still committed on exit."""
+        user = _new_user()
+        db_session.add(user)
+        await db_session.commit()
+
+        session_gen = get_session()
+        session = await session_gen.__anext__()
+        await session.execute(
+            update(User).where(User.email == user.email).values(is_active=False)
+        )
+        await _close(session_gen)
+
+        result = await db_session.execute(
+            select(User.is_active).where(User.email == user.email)
+        )
+        assert result.scalar_one() is False
+
+    async def test_read_only_request_skips_commit(self):
+        """A session that only read data is not committed."""
+        session_gen = get_session()
+        session = await session_gen.__anext__()
+        await session.execute(select(User).limit(1))
+
+        with patch.object(session, "commit", new=AsyncMock()) as commit:
+            await _close(session_gen)
+
+        commit.assert_not_awaited()
+
+
+class TestUserCascade:
+    """Test that deleting a user removes its dependent rows in the database."""
+
+    async def test_delete_user_cascades(self, db_session: AsyncSession):
+        """Sessions and reset tokens go with the user (ON DELETE CASCADE)."""
+        user = _new_user()
+        expires_at = datetime.now(UTC).replace(tzinfo=None) + timedelta(hours=1)
+        db_session.add_all([
+            user,
+            Session(user_id=user.id, token_hash="s" * 64, expires_at=expires_at),
+            PasswordResetToken(user_id=user.id, token_hash="r" * 64, expires_at=expires_at),
+        ])
+        await db_session.commit()
+
+        await db_session.delete(user)
+        await db_session.commit()
+
+        sessions = await db_session.execute(select(Session).where(Session.user_id == user.id))
+        tokens = await db_session.execute(
+            select(PasswordResetToken).where(PasswordResetToken.user_id == user.id)
+        )
+        assert sessions.scalars().all() == []
+        assert tokens.scalars().all() == []
+
+
+def _create_pre_cascade_schema(conn) -> None:
+    """Create the tables as earlier releases did, without ON DELETE CASCADE."""
+    old_metadata = MetaData()
+    for table in SQLModel.metadata.sorted_tables:
+        old_table = table.to_metadata(old_metadata)
+        for constraint in old_table.foreign_key_constraints:
+            constraint.ondelete = None
+    old_metadata.create_all(conn)
+
+
+def _user_fk_ondelete(conn, table_name: str) -> list[str | None]:
+    return [
+        fk["options"].get("ondelete")
+        for fk in inspect(conn).get_foreign_keys(table_name)
+        if fk["referred_table"] == "users"
+    ]
+
+
+def _index_names(conn, table_name: str) -> set[str]:
+    return {index["name"] for index in inspect(conn).get_indexes(table_name)}
+
+
+class TestSchemaUpgrade:
+    """Test upgrade_schema on databases created before the current models."""
+
+    async def test_adds_user_cascade_and_keeps_rows(self):
+        """Existing user_id foreign keys gain ON DELETE CASCADE; rows survive."""
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+        user_id = uuid4().hex
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(_create_pre_cascade_schema)
+                await conn.execute(
+                    text(
+                        "INSERT INTO users (id, email, hashed_password, is_active, "
+                        "is_superuser, created_at, updated_at, failed_login_attempts, "
+                        "must_change_password) VALUES (:id, 'old@example.com', 'x', 1, 0, "
+                        "'2026-01-01', '2026-01-01', 0, 0)"
+                    ),
+                    {"id": user_id},
+                )
+                await conn.execute(
+                    text(
+                        "INSERT INTO sessions (id, user_id, token_hash, created_at, "
+                        "expires_at, is_revoked) VALUES (:id, :user_id, 'h', "
+                        "'2026-01-01', '2026-01-02', 0)"
+                    ),
+                    {"id": uuid4().hex, "user_id": user_id},
+                )
+                assert await conn.run_sync(_user_fk_ondelete, "sessions") == [None]
+
+            async with engine.begin() as conn:
+                await conn.run_sync(upgrade_schema)
+                # A second run finds nothing to do
+                await conn.run_sync(upgrade_schema)
+
+            async with engine.connect() as conn:
+                for table_name in ("sessions", "password_reset_tokens"):
+                    assert await conn.run_sync(_user_fk_ondelete, table_name) == ["CASCADE"]
+                result = await conn.execute(text("SELECT user_id FROM sessions"))
+                assert result.scalars().all() == [user_id]
+        finally:
+            await engine.dispose()
+
+    async def test_creates_new_indexes_and_drops_retired(self):
+        """Indexes added since the schema was created appear; replaced ones go."""
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(SQLModel.metadata.create_all)
+                await conn.execute(text("DROP INDEX ix_sessions_user_active"))
+                await conn.execute(text("CREATE INDEX ix_sessions_user_id ON sessions (user_id)"))
+
+            async with engine.begin() as conn:
+                await conn.run_sync(upgrade_schema)
+
+            async with engine.connect() as conn:
+                indexes = await conn.run_sync(_index_names, "sessions")
+                user_indexes = await conn.run_sync(_index_names, "users")
+            assert "ix_sessions_user_active" in indexes
+            assert "ix_sessions_user_id" not in indexes
+            # PostgreSQL-only covering index is not created on SQLite
+            assert "ix_users_email_covering" not in user_indexes
+        finally:
+            await engine.dispose()
@@ -1,16 +1,21 @@
 """Tests for document upload endpoint."""
 
+import hashlib
 import io
 from pathlib import Path
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
+from fastapi import HTTPException, UploadFile
 from httpx import AsyncClient
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.domain.services.auth import hash_password, create_access_token, hash_token
+from src.domain.services.auth import create_access_token, hash_token
+from src.pipeline import file_storage
+from src.pipeline.file_storage import save_upload, save_uploads
 from src.storage.models import Document, User, Session
+from tests.conftest import cached_password_hash
 
 # Minimal valid PDF bytes (PDF 1.4 format)
 MINIMAL_PDF = b"""%PDF-1.4
@@ -33,8 +38,8 @@ startxref
 async def cleanup_uploads():
     """Clean up uploaded files after tests."""
     yield
-    # Clean up data/uploads/ directory after test
-    upload_dir = Path("data/uploads")
+    # Clean up the upload directory after test
+    upload_dir = file_storage.UPLOAD_DIR
     if upload_dir.exists():
         for file in upload_dir.glob("*"):
             if file.is_file():
@@ -49,12 +54,11 @@ async def test_user(db_session: AsyncSession):
         select(User.id).where(User.email == "doctest@example.com")
     )))
     await db_session.execute(delete(User).where(User.email == "doctest@example.com"))
-    await db_session.commit()
 
     user = User(
         id=uuid4(),
         email="doctest@example.com",
-        hashed_password=hash_password("testpass123"),
+        hashed_password=cached_password_hash("testpass123"),
         is_active=True,
         is_superuser=False,
         failed_login_attempts=0,
@@ -91,7 +95,7 @@ async def auth_headers(db_session: AsyncSession, test_user: User):
 async def test_upload_pdf_success(client: AsyncClient, cleanup_uploads, auth_headers):
     """Test successful PDF upload returns 201 with document metadata."""
     # Create PDF file data
-    files = {"file": ("test.pdf", io.BytesIO(MINIMAL_PDF), "application/pdf")}
+    files = {"file": ("test.pdf", MINIMAL_PDF, "application/pdf")}
 
     response = await client.post("/documents/upload", files=files, headers=auth_headers)
 
@@ -115,7 +119,7 @@ async def test_upload_non_pdf_rejected(client: AsyncClient, cleanup_uploads, aut
     """Test non-PDF file upload returns 400."""
     # Create a text file instead of PDF
     text_content = b"This is not a PDF file"
-    files = {"file": ("test.txt", io.BytesIO(text_content), "text/plain")}
+    files = {"file": ("test.txt", text_content, "text/plain")}
 
     response = await client.post("/documents/upload", files=files, headers=auth_headers)
 
@@ -127,7 +131,7 @@ async def test_upload_non_pdf_rejected(client: AsyncClient, cleanup_uploads, aut
 async def test_upload_empty_file_rejected(client: AsyncClient, cleanup_uploads, auth_headers):
     """Test empty file upload returns 400."""
     # Create empty file
-    files = {"file": ("empty.pdf", io.BytesIO(b""), "application/pdf")}
+    files = {"file": ("empty.pdf", b"", "application/pdf")}
 
     response = await client.post("/documents/upload", files=files, headers=auth_headers)
 
@@ -142,7 +146,7 @@ async def test_upload_creates_database_record(
     """Test upload creates Document record in database."""
     from uuid import UUID
 
-    files = {"file": ("test.pdf", io.BytesIO(MINIMAL_PDF), "application/pdf")}
+    files = {"file": ("test.pdf", MINIMAL_PDF, "application/pdf")}
 
     response = await client.post("/documents/upload", files=files, headers=auth_headers)
     assert response.status_code == 201
@@ -164,7 +168,7 @@ async def test_upload_creates_database_record(
 @pytest.mark.asyncio
 async def test_upload_file_saved_to_disk(client: AsyncClient, cleanup_uploads, auth_headers):
     """Test uploaded file is saved to disk at correct location."""
-    files = {"file": ("test.pdf", io.BytesIO(MINIMAL_PDF), "application/pdf")}
+    files = {"file": ("test.pdf", MINIMAL_PDF, "application/pdf")}
 
     response = await client.post("/documents/upload", files=files, headers=auth_headers)
     assert response.status_code == 201
@@ -173,7 +177,7 @@ async def test_upload_file_saved_to_disk(client: AsyncClient, cleanup_uploads, a
     file_hash = response.json()["file_hash"]
 
     # Verify file exists in upload directory
-    upload_dir = Path("data/uploads")
+    upload_dir = file_storage.UPLOAD_DIR
     assert upload_dir.exists()
 
     # Find file by checking hash matches
@@ -194,9 +198,93 @@ async def test_upload_file_saved_to_disk(client: AsyncClient, cleanup_uploads, a
 @pytest.mark.asyncio
 async def test_upload_without_auth_returns_401(client: AsyncClient, cleanup_uploads):
     """Test upload without authentication returns 401."""
-    files = {"file": ("test.pdf", io.BytesIO(MINIMAL_PDF), "application/pdf")}
+    files = {"file": ("test.pdf", MINIMAL_PDF, "application/pdf")}
 
     response = await client.post("/documents/upload", files=files)
 
     assert response.status_code == 401
     assert "Authentication required" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_save_upload_streams_in_chunks(monkeypatch, cleanup_uploads):
+    """Files spanning many chunks are hashed and written intact."""
+    monkeypatch.setattr(file_storage, "CHUNK_SIZE", 7)
+    upload = UploadFile(file=io.BytesIO(MINIMAL_PDF), filename="chunked.pdf")
+
+    file_path, file_hash, file_size = await save_upload(upload)
+
+    assert file_size == len(MINIMAL_PDF)
+    assert file_hash == hashlib.sha256(MINIMAL_PDF).hexdigest()
+    assert Path(file_path).read_bytes() == MINIMAL_PDF
+
+
+@pytest.mark.asyncio
+async def test_save_uploads_hashes_each_file(cleanup_uploads):
+    """Batch saves return per-file metadata in input order."""
+    contents = [MINIMAL_PDF, MINIMAL_PDF + b"\n% second"]
+    uploads = [
+        UploadFile(file=io.BytesIO(content), filename=f"batch{i}.pdf")
+        for i, content in enumerate(contents)
+    ]
+
+    saved = await save_uploads(uploads)
+
+    assert [file_hash for _, file_hash, _ in saved] == [
+        hashlib.sha256(content).hexdigest() for content in contents
+    ]
+    for (file_path, _, file_size), content in zip(saved, contents, strict=True):
+        assert file_size == len(content)
+        assert Path(file_path).read_bytes() == content
+
+
+@pytest.mark.asyncio
+async def test_save_uploads_rejects_batch_before_writing(cleanup_uploads):
+    """A non-PDF in the batch fails the whole batch without writing files."""
+    uploads = [
+        UploadFile(file=io.BytesIO(MINIMAL_PDF), filename="ok.pdf"),
+        UploadFile(file=io.BytesIO(b"text"), filename="notes.txt"),
+    ]
+
+    with pytest.raises(HTTPException) as exc_info:
+        await save_uploads(uploads)
+
+    assert exc_info.value.status_code == 400
+    assert not list(file_storage.UPLOAD_DIR.glob("*ok.pdf"))
+
+
+@pytest.mark.asyncio
+async def test_save_uploads_rejects_empty_file_before_writing(cleanup_uploads):
+    """An empty file later in the batch fails it before earlier files are written."""
+    uploads = [
+        UploadFile(file=io.BytesIO(MINIMAL_PDF), filename="first.pdf"),
+        UploadFile(file=io.BytesIO(b""), filename="empty.pdf"),
+    ]
+
+    with pytest.raises(HTTPException) as exc_info:
+        await save_uploads(uploads)
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail == "Uploaded file is empty"
+    assert not list(file_storage.UPLOAD_DIR.glob("*first.pdf"))
+
+
+@pytest.mark.asyncio
+async def test_duplicate_upload_reuses_stored_file(
+    client: AsyncClient, db_session: AsyncSession, cleanup_uploads, auth_headers
+):
+    """Re-uploading identical content creates a new record but no new file."""
+    document_ids = []
+    for filename in ("first.pdf", "second.pdf"):
+        files = {"file": (filename, MINIMAL_PDF, "application/pdf")}
+        response = await client.post("/documents/upload", files=files, headers=auth_headers)
+        assert response.status_code == 201
+        document_ids.append(UUID(response.json()["id"]))
+
+    result = await db_session.execute(select(Document).where(Document.id.in_(document_ids)))
+    documents = result.scalars().all()
+
+    assert len(documents) == 2
+    assert documents[0].file_path == documents[1].file_path
+    assert {d.filename for d in documents} == {"first.pdf", "second.pdf"}
+    assert len(list(file_storage.UPLOAD_DIR.glob("*.pdf"))) == 1
@@ -1,7 +1,9 @@
 """Tests for PDF extraction endpoints."""
 
-import io
+import asyncio
+import threading
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 from uuid import UUID, uuid4
 
@@ -17,8 +19,11 @@ from src.domain.schemas.extraction import (
     ExtractedField,
     FieldLocation,
 )
-from src.domain.services.auth import hash_password, create_access_token, hash_token
+from src.domain.services.auth import create_access_token, hash_token
+from src.pipeline import file_storage
+from src.pipeline.extraction import extract_document
 from src.storage.models import Document, User, Session, ValidationResult
+from tests.conftest import cached_password_hash
 
 # Import MINIMAL_PDF from test_documents
 from tests.test_documents import MINIMAL_PDF
@@ -28,7 +33,7 @@ from tests.test_documents import MINIMAL_PDF
 async def cleanup_uploads():
     """Clean up uploaded files after tests."""
     yield
-    upload_dir = Path("data/uploads")
+    upload_dir = file_storage.UPLOAD_DIR
     if upload_dir.exists():
         for file in upload_dir.glob("*"):
             if file.is_file():
@@ -43,12 +48,11 @@ async def test_user(db_session: AsyncSession):
         select(User.id).where(User.email == "extracttest@example.com")
     )))
     await db_session.execute(delete(User).where(User.email == "extracttest@example.com"))
-    await db_session.commit()
 
     user = User(
         id=uuid4(),
         email="extracttest@example.com",
-        hashed_password=hash_password("testpass123"),
+        hashed_password=cached_password_hash("testpass123"),
         is_active=True,
         is_superuser=False,
         failed_login_attempts=0,
@@ -124,7 +128,7 @@ def create_mock_extraction_result(document_id: str) -> ExtractionResult:
 
 async def upload_test_document(client: AsyncClient, auth_headers: dict) -> str:
     """Helper to upload a test document and return its ID."""
-    files = {"file": ("test.pdf", io.BytesIO(MINIMAL_PDF), "application/pdf")}
+    files = {"file": ("test.pdf", MINIMAL_PDF, "application/pdf")}
     response = await client.post("/documents/upload", files=files, headers=auth_headers)
     assert response.status_code == 201
     return response.json()["id"]
@@ -397,3 +401,70 @@ async def test_extraction_failure_handling(
     document = result.scalar_one_or_none()
     assert document is not None
     assert document.status == "failed"
+
+
+class FakeLandingAIClient:
+    """Stand-in for LandingAIADE returning one grounded chunk per document."""
+
+    def __init__(self):
+        self.call_threads: list[threading.Thread] = []
+
+    def parse(self, document, model):
+        self.call_threads.append(threading.current_thread())
+        return SimpleNamespace(
+            markdown="# Report",
+            chunks=[
+                SimpleNamespace(id="chunk-0", grounding=None),
+                SimpleNamespace(
+                    id="chunk-1",
+                    grounding=SimpleNamespace(
+                        page=2,
+                        box=SimpleNamespace(left=0.1, top=0.2, right=0.3, bottom=0.4),
+                    ),
+                ),
+            ],
+            metadata=SimpleNamespace(page_count=3),
+        )
+
+    def extract(self, schema, markdown, model):
+        self.call_threads.append(threading.current_thread())
+        return SimpleNamespace(
+            extraction={"instrument_serial_number": "ABC123", "test_type": "megger"},
+            extraction_metadata={"instrument_serial_number": {"references": ["chunk-1"]}},
+        )
+
+
+@pytest.mark.asyncio
+async def test_extract_document_runs_sdk_calls_off_event_loop():
+    """SDK calls run in worker threads and field locations resolve from chunks."""
+    fake_client = FakeLandingAIClient()
+
+    with patch("src.pipeline.extraction.get_client", return_value=fake_client):
+        results = await asyncio.gather(
+            extract_document(Path("a.pdf")), extract_document(Path("b.pdf"))
+        )
+
+    assert [r.status for r in results] == ["completed", "completed"]
+    assert threading.main_thread() not in fake_client.call_threads
+
+    serial = results[0].calibrations[0].serial_number
+    assert serial.value == "ABC123"
+    assert serial.location.page == 2
+    assert serial.location.chunk_id == "chunk-1"
+    assert serial.location.bbox.bottom == 0.4
+    assert results[0].page_count == 3
+
+
+def test_extract_document_concurrency_cap_works_across_event_loops(monkeypatch):
+    """Contended extractions succeed on each new event loop, not just the first."""
+    monkeypatch.setattr("src.pipeline.extraction._EXTRACT_CONCURRENCY", 1)
+
+    async def extract_pair():
+        return await asyncio.gather(
+            extract_document(Path("a.pdf")), extract_document(Path("b.pdf"))
+        )
+
+    with patch("src.pipeline.extraction.get_client", return_value=FakeLandingAIClient()):
+        for _ in range(2):
+            results = asyncio.run(extract_pair())
+            assert [r.status for r in results] == ["completed", "completed"]
@@ -141,6 +141,17 @@ class TestGroundingCalibrationValidation:
         assert "missing" in findings[0].message.lower()
         assert "manual review" in findings[0].message.lower()
 
+    def test_grounding_calibration_no_calibration_info_custom_rule_id(self):
+        """Custom rule_id is applied to the missing calibration WARNING."""
+        grounding = GroundingData(calibration=None)
+        test_date = date(2024, 1, 22)
+
+        findings = validate_grounding_calibration(grounding, test_date, rule_id="CUSTOM-03")
+
+        assert len(findings) == 1
+        assert findings[0].rule_id == "CUSTOM-03"
+        assert "grounding meter calibration" in findings[0].message.lower()
+
     def test_grounding_calibration_rule_id(self, sample_location):
         """Findings have GROUND-01 rule_id."""
         calibration = create_calibration_info("2025-12-31", location=sample_location)
@@ -253,6 +264,17 @@ class TestMeggerCalibrationValidation:
         assert "missing" in findings[0].message.lower()
         assert "manual review" in findings[0].message.lower()
 
+    def test_megger_calibration_no_calibration_info_custom_rule_id(self):
+        """Custom rule_id is applied to the missing calibration WARNING."""
+        megger = MeggerData(calibration=None)
+        test_date = date(2024, 1, 22)
+
+        findings = validate_megger_calibration(megger, test_date, rule_id="CUSTOM-03")
+
+        assert len(findings) == 1
+        assert findings[0].rule_id == "CUSTOM-03"
+        assert "megger calibration" in findings[0].message.lower()
+
     def test_megger_calibration_rule_id(self, sample_location):
         """Findings have MEGGER-01 rule_id."""
         calibration = create_calibration_info("2025-12-31", location=sample_location)
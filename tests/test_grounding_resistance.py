@@ -134,6 +134,15 @@ class TestGroundingResistanceEdgeCases:
         assert len(findings) == 1
         assert findings[0].severity == FindingSeverity.INFO
 
+    def test_resistance_signed_zero_reports_document_value(self):
+        """0.0 and -0.0 compare equal but each finding shows its own reading."""
+        zero = validate_grounding_resistance(make_grounding_data("0.0"))[0]
+        negative_zero = validate_grounding_resistance(make_grounding_data("-0.0"))[0]
+
+        assert zero.found_value == "0.0 ohms"
+        assert negative_zero.found_value == "-0.0 ohms"
+        assert "-0.0 ohms" in negative_zero.message
+
     def test_resistance_empty_string(self):
         """Empty string resistance should be WARNING - missing data."""
         grounding = GroundingData(
@@ -144,6 +153,25 @@ class TestGroundingResistanceEdgeCases:
         assert len(findings) == 1
         assert findings[0].severity == FindingSeverity.WARNING
 
+    def test_resistance_whitespace_only(self):
+        """Whitespace-only resistance should be WARNING - missing data."""
+        grounding = GroundingData(
+            resistance_value=ExtractedField(name="resistance", value="   ")
+        )
+        findings = validate_grounding_resistance(grounding)
+
+        assert len(findings) == 1
+        assert findings[0].severity == FindingSeverity.WARNING
+        assert "missing or empty" in findings[0].message.lower()
+
+    def test_resistance_surrounding_whitespace(self):
+        """Resistance with surrounding whitespace still parses."""
+        grounding = make_grounding_data(" 2.5 ")
+        findings = validate_grounding_resistance(grounding)
+
+        assert len(findings) == 1
+        assert findings[0].severity == FindingSeverity.INFO
+
 
 class TestGroundingResistanceMetadata:
     """Test finding metadata and rule ID."""
@@ -15,8 +15,8 @@ from httpx import AsyncClient
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.domain.services.auth import hash_password
 from src.storage.models import Document, User, ValidationResult, ValidationStatus
+from tests.conftest import cached_password_hash
 
 
 @pytest.fixture
@@ -42,12 +42,11 @@ async def test_user(db_session: AsyncSession):
         await db_session.execute(
             delete(User).where(User.email == "historyuser@example.com")
         )
-        await db_session.commit()
 
     user = User(
         id=uuid4(),
         email="historyuser@example.com",
-        hashed_password=hash_password("testpass123"),
+        hashed_password=cached_password_hash("testpass123"),
         is_active=True,
         is_superuser=False,
         failed_login_attempts=0,
@@ -82,12 +81,11 @@ async def admin_user(db_session: AsyncSession):
         await db_session.execute(
             delete(User).where(User.email == "historyadmin@example.com")
         )
-        await db_session.commit()
 
     user = User(
         id=uuid4(),
         email="historyadmin@example.com",
-        hashed_password=hash_password("adminpass123"),
+        hashed_password=cached_password_hash("adminpass123"),
         is_active=True,
         is_superuser=True,  # Admin!
         failed_login_attempts=0,
@@ -122,12 +120,11 @@ async def other_user(db_session: AsyncSession):
         await db_session.execute(
             delete(User).where(User.email == "otheruser@example.com")
         )
-        await db_session.commit()
 
     user = User(
         id=uuid4(),
         email="otheruser@example.com",
-        hashed_password=hash_password("otherpass123"),
+        hashed_password=cached_password_hash("otherpass123"),
         is_active=True,
         is_superuser=False,
         failed_login_attempts=0,
@@ -1,13 +1,18 @@
 """Tests for megger voltage and insulation resistance validators.
 
-Tests MEGGER-02 (test voltage appropriateness) and MEGGER-03 (insulation resistance minimum).
+Tests MEGGER-02 (test voltage appropriateness) and MEGGER-03 (insulation resistance minimum),
+plus the combined validate_megger_all pass.
 Following TDD: Write tests first, then implement to pass.
 """
 
+from datetime import date
+
 import pytest
 
 from src.domain.schemas.evidence import FindingSeverity
 from src.domain.schemas.extraction import ExtractedField, MeggerData
+from src.domain.validators.megger import validate_megger_all
+from src.domain.validators.megger_calibration import validate_megger_calibration
 from src.domain.validators.megger_voltage import validate_test_voltage
 from src.domain.validators.megger_insulation import validate_insulation_resistance
 
@@ -147,6 +152,39 @@ class TestMeggerVoltageValidator:
         assert len(findings) == 1
         assert findings[0].severity == FindingSeverity.INFO
 
+    def test_voltage_class_boundary_251v_equipment(self):
+        """251V equipment falls into the 500V class - 500V test is below recommended 1000V."""
+        megger = MeggerData(
+            equipment_voltage_rating=ExtractedField(name="voltage_rating", value="251"),
+            test_voltage=ExtractedField(name="test_voltage", value="500"),
+        )
+        findings = validate_test_voltage(megger)
+        assert len(findings) == 1
+        assert findings[0].severity == FindingSeverity.WARNING
+        assert findings[0].expected_value == ">= 1000V"
+
+    def test_voltage_class_fractional_equipment_rating(self):
+        """250.5V equipment is above the 250V class, not truncated into it."""
+        megger = MeggerData(
+            equipment_voltage_rating=ExtractedField(name="voltage_rating", value="250.5"),
+            test_voltage=ExtractedField(name="test_voltage", value="500"),
+        )
+        findings = validate_test_voltage(megger)
+        assert len(findings) == 1
+        assert findings[0].severity == FindingSeverity.WARNING
+        assert findings[0].expected_value == ">= 1000V"
+
+    def test_voltage_nan_equipment_rating_unknown_class(self):
+        """NaN equipment rating has no voltage class - WARNING for manual review."""
+        megger = MeggerData(
+            equipment_voltage_rating=ExtractedField(name="voltage_rating", value="nan"),
+            test_voltage=ExtractedField(name="test_voltage", value="500"),
+        )
+        findings = validate_test_voltage(megger)
+        assert len(findings) == 1
+        assert findings[0].severity == FindingSeverity.WARNING
+        assert "unknown voltage class" in findings[0].message.lower()
+
 
 class TestMeggerInsulationValidator:
     """Test MEGGER-03 insulation resistance minimum validation."""
@@ -290,3 +328,58 @@ class TestMeggerInsulationValidator:
         findings = validate_insulation_resistance(megger)
         assert len(findings) == 1
         assert findings[0].severity == FindingSeverity.WARNING
+
+    def test_insulation_class_boundary_251v_equipment(self):
+        """251V equipment falls into the 500V class - minimum is 0.5 Mohm."""
+        megger = MeggerData(
+            equipment_voltage_rating=ExtractedField(name="voltage_rating", value="251"),
+            insulation_resistance=ExtractedField(name="resistance", value="0.3"),
+        )
+        findings = validate_insulation_resistance(megger)
+        assert len(findings) == 1
+        assert findings[0].severity == FindingSeverity.WARNING
+        assert findings[0].expected_value == ">= 0.5 Mohm"
+
+    def test_insulation_class_fractional_equipment_rating(self):
+        """250.5V equipment is above the 250V class - minimum is 0.5 Mohm."""
+        megger = MeggerData(
+            equipment_voltage_rating=ExtractedField(name="voltage_rating", value="250.5"),
+            insulation_resistance=ExtractedField(name="resistance", value="0.3"),
+        )
+        findings = validate_insulation_resistance(megger)
+        assert len(findings) == 1
+        assert findings[0].severity == FindingSeverity.WARNING
+        assert findings[0].expected_value == ">= 0.5 Mohm"
+
+
+class TestMeggerAllValidator:
+    """Test the combined MEGGER-01/02/03 single-pass validator."""
+
+    @pytest.mark.parametrize(
+        "equipment_rating,test_voltage,resistance",
+        [
+            ("480", "1000", "50"),
+            ("250", "1000", "0.1"),
+            ("abc", "1000", "50"),
+            ("480", None, "50"),
+            (None, "1000", "50"),
+        ],
+    )
+    def test_matches_individual_validators(self, equipment_rating, test_voltage, resistance):
+        """Combined pass returns the same findings as running each rule separately."""
+        megger = MeggerData(
+            equipment_voltage_rating=ExtractedField(name="voltage_rating", value=equipment_rating),
+            test_voltage=ExtractedField(name="test_voltage", value=test_voltage),
+            insulation_resistance=ExtractedField(name="resistance", value=resistance),
+        )
+        test_date = date(2024, 1, 22)
+
+        expected = (
+            validate_megger_calibration(megger, test_date)
+            + validate_test_voltage(megger)
+            + validate_insulation_resistance(megger)
+        )
+        findings = validate_megger_all(megger, test_date)
+
+        assert findings == expected
+        assert [f.rule_id for f in findings] == ["MEGGER-01", "MEGGER-02", "MEGGER-03"]
@@ -0,0 +1,52 @@
+"""Unit tests for numeric_parser module.
+
+Tests cover the numeric forms found in extracted measurement values
+and the None contract for unparseable input.
+"""
+
+import math
+
+import pytest
+
+from src.domain.validators.numeric_parser import parse_float
+
+
+class TestParseFloat:
+    """Tests for parse_float."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("5", 5.0),
+            ("3.2", 3.2),
+            ("-0.5", -0.5),
+            ("+10", 10.0),
+            (".5", 0.5),
+            ("5.", 5.0),
+            ("1e3", 1000.0),
+            ("2.5E-2", 0.025),
+            ("  4.75  ", 4.75),
+            ("inf", math.inf),
+            ("1_000", 1000.0),
+            ("1_000.000_5", 1000.0005),
+            ("1e1_0", 1e10),
+        ],
+    )
+    def test_numeric_values_parse(self, value, expected):
+        """Numeric strings accepted by float() parse to the same value."""
+        assert parse_float(value) == expected
+
+    def test_nan_parses(self):
+        """'nan' parses like float() so callers can flag it downstream."""
+        assert math.isnan(parse_float("nan"))
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "", "   ", "abc", "5 ohms", "1.2.3", ".", "-", "e5", "0x10", "5,2",
+            "_1", "1_", "1__0", "1_.5",
+        ],
+    )
+    def test_invalid_values_return_none(self, value):
+        """Non-numeric strings return None instead of raising."""
+        assert parse_float(value) is None
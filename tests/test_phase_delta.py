@@ -104,3 +104,16 @@ class TestPhaseDeltaValidator:
         findings = validate_phase_delta(readings)
         assert len(findings) >= 1
         assert any(f.severity == FindingSeverity.WARNING for f in findings)
+
+    def test_message_names_hottest_and_coldest_phase(self):
+        """Message reports the max/min phases, first phase winning on ties."""
+        readings = [
+            MeasurementReading(
+                location_label=label, value=ExtractedField(name="temp", value=value)
+            )
+            for label, value in [("Phase A", "30.0"), ("Phase B", "25.0"), ("Phase C", "30.0")]
+        ]
+        findings = validate_phase_delta(readings)
+        assert len(findings) == 1
+        assert findings[0].severity == FindingSeverity.WARNING
+        assert "(Phase A: 30.0C, Phase B: 25.0C)" in findings[0].message
@@ -7,10 +7,8 @@ Tests cover the full validation flow:
 - Custom test date parameter
 """
 
-import io
 import json
 from datetime import date
-from pathlib import Path
 from unittest.mock import AsyncMock, patch
 from uuid import UUID, uuid4
 
@@ -26,8 +24,10 @@ from src.domain.schemas.extraction import (
     ExtractedField,
     FieldLocation,
 )
-from src.domain.services.auth import hash_password, create_access_token, hash_token
+from src.domain.services.auth import create_access_token, hash_token
+from src.pipeline import file_storage
 from src.storage.models import Document, User, Session, ValidationResult, ValidationStatus
+from tests.conftest import cached_password_hash
 
 # Import MINIMAL_PDF from test_documents
 from tests.test_documents import MINIMAL_PDF
@@ -42,7 +42,7 @@ from tests.test_documents import MINIMAL_PDF
 async def cleanup_uploads():
     """Clean up uploaded files after tests."""
     yield
-    upload_dir = Path("data/uploads")
+    upload_dir = file_storage.UPLOAD_DIR
     if upload_dir.exists():
         for file in upload_dir.glob("*"):
             if file.is_file():
@@ -57,12 +57,11 @@ async def test_user(db_session: AsyncSession):
         select(User.id).where(User.email == "validateep@example.com")
     )))
     await db_session.execute(delete(User).where(User.email == "validateep@example.com"))
-    await db_session.commit()
 
     user = User(
         id=uuid4(),
         email="validateep@example.com",
-        hashed_password=hash_password("testpass123"),
+        hashed_password=cached_password_hash("testpass123"),
         is_active=True,
         is_superuser=False,
         failed_login_attempts=0,
@@ -187,7 +186,7 @@ def create_mock_extraction_result(
 
 async def upload_test_document(client: AsyncClient, auth_headers: dict) -> str:
     """Helper to upload a test document and return its ID."""
-    files = {"file": ("test.pdf", io.BytesIO(MINIMAL_PDF), "application/pdf")}
+    files = {"file": ("test.pdf", MINIMAL_PDF, "application/pdf")}
     response = await client.post("/documents/upload", files=files, headers=auth_headers)
     assert response.status_code == 201
     return response.json()["id"]
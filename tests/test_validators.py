@@ -401,6 +401,26 @@ class TestSerialValidation:
         assert "ABC123" in error_finding.found_value
         assert "XYZ789" in error_finding.found_value
 
+    def test_serial_mismatch_dedupes_repeated_locations(
+        self, sample_location, sample_location_page_2
+    ):
+        """A serial repeated at the same location gets one supplementary finding."""
+        serials = [
+            ExtractedField(name="serial_number", value="ABC123", location=sample_location),
+            ExtractedField(name="serial_number", value="abc123", location=sample_location),
+            ExtractedField(name="serial_number", value="XYZ789", location=sample_location_page_2),
+            ExtractedField(name="serial_number", value="ABC123", location=sample_location_page_2),
+        ]
+
+        findings = validate_serial_consistency(serials)
+
+        info_findings = [f for f in findings if f.severity == FindingSeverity.INFO]
+        assert [(f.found_value, f.location.page) for f in info_findings] == [
+            ("ABC123", sample_location.page),
+            ("XYZ789", sample_location_page_2.page),
+            ("ABC123", sample_location_page_2.page),
+        ]
+
     def test_serial_three_way_match(self, sample_location):
         """Three matching serial numbers all pass."""
         serials = [